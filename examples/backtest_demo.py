@@ -23,8 +23,11 @@ Configuration:
 """
 
 import logging
+from dataclasses import asdict
 from pathlib import Path
 
+import numpy as np
+
 from example_data import generate_example_data
 from aponyx.models import (
     compute_cdx_etf_basis,
@@ -34,6 +37,7 @@ from aponyx.backtest import (
     BacktestConfig,
     run_backtest,
     compute_performance_metrics,
+    position_change_mask,
 )
 
 # Configure logging
@@ -43,6 +47,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Indexed by position + 1 (short=-1, flat=0, long=+1)
+_POSITION_LABELS = ("SHORT", "FLAT", "LONG")
+
+_PERFORMANCE_TEMPLATE = """
+----------------------------------------------------------------------
+PERFORMANCE SUMMARY
+----------------------------------------------------------------------
+  Sharpe Ratio:           {sharpe_ratio:>8.2f}
+  Sortino Ratio:          {sortino_ratio:>8.2f}
+  Calmar Ratio:           {calmar_ratio:>8.2f}
+  Max Drawdown:           ${max_drawdown:>8,.0f}
+  Total Return:           ${total_return:>8,.0f}
+  Annualized Return:      ${annualized_return:>8,.0f}
+  Annualized Volatility:  ${annualized_volatility:>8,.0f}
+----------------------------------------------------------------------
+  Hit Rate:               {hit_rate:>8.1%}
+  Average Win:            ${avg_win:>8,.0f}
+  Average Loss:           ${avg_loss:>8,.0f}
+  Win/Loss Ratio:         {win_loss_ratio:>8.2f}
+  Number of Trades:       {n_trades:>8}
+  Avg Holding Days:       {avg_holding_days:>8.1f}
+----------------------------------------------------------------------"""
+
+
+def _describe_numeric(values: np.ndarray) -> dict[str, float]:
+    """Summary statistics matching pd.Series.describe() in one percentile pass."""
+    minimum, q25, median, q75, maximum = np.percentile(values, [0, 25, 50, 75, 100])
+    return {
+        "mean": float(values.mean()),
+        "std": float(values.std(ddof=1)),
+        "min": float(minimum),
+        "25%": float(q25),
+        "50%": float(median),
+        "75%": float(q75),
+        "max": float(maximum),
+    }
+
 
 def main() -> None:
     """Run complete backtest demonstration."""
@@ -92,42 +133,25 @@ def main() -> None:
     print("\n[4] Computing performance metrics...")
     metrics = compute_performance_metrics(result.pnl, result.positions)
 
-    print("\n" + "-" * 70)
-    print("PERFORMANCE SUMMARY")
-    print("-" * 70)
-    print(f"  Sharpe Ratio:           {metrics.sharpe_ratio:>8.2f}")
-    print(f"  Sortino Ratio:          {metrics.sortino_ratio:>8.2f}")
-    print(f"  Calmar Ratio:           {metrics.calmar_ratio:>8.2f}")
-    print(f"  Max Drawdown:           ${metrics.max_drawdown:>8,.0f}")
-    print(f"  Total Return:           ${metrics.total_return:>8,.0f}")
-    print(f"  Annualized Return:      ${metrics.annualized_return:>8,.0f}")
-    print(f"  Annualized Volatility:  ${metrics.annualized_volatility:>8,.0f}")
-    print("-" * 70)
-    print(f"  Hit Rate:               {metrics.hit_rate:>8.1%}")
-    print(f"  Average Win:            ${metrics.avg_win:>8,.0f}")
-    print(f"  Average Loss:           ${metrics.avg_loss:>8,.0f}")
-    print(f"  Win/Loss Ratio:         {metrics.win_loss_ratio:>8.2f}")
-    print(f"  Number of Trades:       {metrics.n_trades:>8}")
-    print(f"  Avg Holding Days:       {metrics.avg_holding_days:>8.1f}")
-    print("-" * 70)
+    print(_PERFORMANCE_TEMPLATE.format_map(asdict(metrics)))
 
     # 5. Show sample trades
     print("\n[5] Sample trade history (first 10 position changes):")
     print("-" * 70)
 
-    position_changes = result.positions[result.positions["position"].diff().fillna(0) != 0]
-    sample_trades = position_changes.head(10)
+    change_mask = position_change_mask(result.positions)
+    sample_trades = result.positions.iloc[change_mask].head(10)
 
-    for date, row in sample_trades.iterrows():
-        position_label = {1: "LONG", -1: "SHORT", 0: "FLAT"}[row["position"]]
-        print(f"  {date.strftime('%Y-%m-%d')}: {position_label:>6} | "
-              f"Signal: {row['signal']:>6.2f} | Spread: {row['spread']:>6.1f}")
+    for row in sample_trades.itertuples():
+        position_label = _POSITION_LABELS[row.position + 1]
+        print(f"  {row.Index.strftime('%Y-%m-%d')}: {position_label:>6} | "
+              f"Signal: {row.signal:>6.2f} | Spread: {row.spread:>6.1f}")
 
     # 6. Show P&L distribution
     print("\n[6] P&L distribution (daily net P&L):")
     print("-" * 70)
 
-    pnl_stats = result.pnl["net_pnl"].describe()
+    pnl_stats = _describe_numeric(result.pnl["net_pnl"].to_numpy())
     print(f"  Mean:     ${pnl_stats['mean']:>10,.0f}")
     print(f"  Std Dev:  ${pnl_stats['std']:>10,.0f}")
     print(f"  Min:      ${pnl_stats['min']:>10,.0f}")
@@ -141,9 +165,10 @@ def main() -> None:
     print("-" * 70)
 
     total_days = len(result.positions)
-    long_days = (result.positions["position"] == 1).sum()
-    short_days = (result.positions["position"] == -1).sum()
-    flat_days = (result.positions["position"] == 0).sum()
+    # Single pass over positions: buckets are short (-1), flat (0), long (+1)
+    short_days, flat_days, long_days = np.bincount(
+        result.positions["position"].to_numpy() + 1, minlength=3
+    )
 
     print(f"  Long credit:     {long_days:>4} days ({long_days/total_days:>5.1%})")
     print(f"  Short credit:    {short_days:>4} days ({short_days/total_days:>5.1%})")
@@ -19,6 +19,8 @@ Note: Signals follow the convention:
 
 import logging
 from pathlib import Path
+
+import numpy as np
 import pandas as pd
 
 from example_data import generate_example_data
@@ -34,6 +36,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Category order defines the integer codes assigned in main()
+_POSITION_CATEGORIES = ["no_signal", "long_credit", "short_credit", "neutral"]
+
 
 def main() -> None:
     """Run the models layer demonstration."""
@@ -53,29 +58,26 @@ def main() -> None:
     # Display signal statistics
     logger.info("\n=== Signal Statistics ===")
     valid = signal.dropna()
+    stats = (len(valid), valid.mean(), valid.std(), valid.min(), valid.max())
     logger.info(
         "cdx_etf_basis: valid=%d, mean=%.3f, std=%.3f, range=[%.3f, %.3f]",
-        len(valid),
-        valid.mean(),
-        valid.std(),
-        valid.min(),
-        valid.max(),
+        *stats,
     )
 
     # Generate positions
     threshold = 1.5
     logger.info("\n=== Generating Positions (threshold=%.2f) ===", threshold)
 
-    def classify_position(score: float) -> str:
-        if pd.isna(score):
-            return "no_signal"
-        if score > threshold:
-            return "long_credit"
-        if score < -threshold:
-            return "short_credit"
-        return "neutral"
-
-    positions = signal.apply(classify_position)
+    scores = signal.to_numpy()
+    codes = np.select(
+        [np.isnan(scores), scores > threshold, scores < -threshold],
+        [0, 1, 2],
+        default=3,
+    ).astype(np.int8)
+    positions = pd.Series(
+        pd.Categorical.from_codes(codes, categories=_POSITION_CATEGORIES),
+        index=signal.index,
+    )
     
     result = pd.DataFrame(
         {
@@ -85,26 +87,27 @@ def main() -> None:
     )
 
     # Position distribution
-    pos_counts = result["position"].value_counts()
-    logger.info("Position distribution:\n%s", pos_counts)
+    counts = np.bincount(
+        result["position"].cat.codes.to_numpy(), minlength=len(_POSITION_CATEGORIES)
+    )
+    logger.info(
+        "Position distribution: %s",
+        ", ".join(f"{label}={n}" for label, n in zip(_POSITION_CATEGORIES, counts)),
+    )
 
     # Display sample results
     logger.info("\n=== Sample Results (Last 10 Days) ===")
     print(result.tail(10).to_string())
 
     # Summary statistics
-    logger.info(
+    logger.debug(
         "\n=== Signal Summary ===\n"
         "Valid observations: %d\n"
         "Mean: %.3f\n"
         "Std: %.3f\n"
         "Min: %.3f\n"
         "Max: %.3f",
-        len(valid),
-        valid.mean(),
-        valid.std(),
-        valid.min(),
-        valid.max(),
+        *stats,
     )
 
     logger.info("\n=== Demo Complete ===")
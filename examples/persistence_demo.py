@@ -21,6 +21,7 @@ Key Features:
 
 import logging
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from example_data import generate_persistence_data
@@ -32,7 +33,7 @@ from aponyx.persistence import (
     DataRegistry,
     DatasetEntry,
 )
-from aponyx.config import DATA_DIR, REGISTRY_PATH
+from aponyx.config import DATA_DIR, LOGS_DIR, REGISTRY_PATH, ensure_directories
 
 
 # Configure logging for the demo
@@ -43,6 +44,15 @@ logging.basicConfig(
 )
 
 
+# Dataset name -> display label for the demo output
+_DATASET_LABELS = {
+    "cdx_ig_5y": "CDX IG 5Y",
+    "cdx_hy_5y": "CDX HY 5Y",
+    "vix": "VIX",
+    "hyg_etf": "HYG ETF",
+}
+
+
 def create_sample_data() -> None:
     """
     Create sample market data files for demonstration.
@@ -54,78 +64,74 @@ def create_sample_data() -> None:
     # Generate all datasets using centralized helper
     datasets = generate_persistence_data(periods=209)
 
-    # Save each dataset
-    save_parquet(datasets["cdx_ig_5y"], DATA_DIR / "raw" / "cdx_ig_5y.parquet")
-    print(f"  ✓ Saved CDX IG 5Y: {len(datasets['cdx_ig_5y'])} rows")
-
-    save_parquet(datasets["cdx_hy_5y"], DATA_DIR / "raw" / "cdx_hy_5y.parquet")
-    print(f"  ✓ Saved CDX HY 5Y: {len(datasets['cdx_hy_5y'])} rows")
-
-    save_parquet(datasets["vix"], DATA_DIR / "raw" / "vix.parquet")
-    print(f"  ✓ Saved VIX: {len(datasets['vix'])} rows")
+    # Save datasets concurrently (Arrow encodes and writes with the GIL released)
+    with ThreadPoolExecutor(max_workers=len(_DATASET_LABELS)) as executor:
+        futures = {
+            name: executor.submit(
+                save_parquet, datasets[name], DATA_DIR / "raw" / f"{name}.parquet"
+            )
+            for name in _DATASET_LABELS
+        }
+    for name, label in _DATASET_LABELS.items():
+        futures[name].result()
+        print(f"  ✓ Saved {label}: {len(datasets[name])} rows")
 
-    save_parquet(datasets["hyg_etf"], DATA_DIR / "raw" / "hyg_etf.parquet")
-    print(f"  ✓ Saved HYG ETF: {len(datasets['hyg_etf'])} rows")
 
-
-def register_datasets() -> None:
+def register_datasets(registry: DataRegistry) -> None:
     """
     Register all datasets in the central registry.
 
-    Creates a DataRegistry and registers all available market data files
-    with appropriate metadata.
+    Registers all available market data files with appropriate metadata.
     """
     print("\nRegistering datasets...")
 
-    registry = DataRegistry(REGISTRY_PATH, DATA_DIR)
-
-    # Register CDX instruments
-    registry.register_dataset(
-        name="cdx_ig_5y",
-        file_path=DATA_DIR / "raw" / "cdx_ig_5y.parquet",
-        instrument="CDX.NA.IG",
-        tenor="5Y",
-        metadata={"source": "synthetic", "frequency": "daily"},
-    )
-
-    registry.register_dataset(
-        name="cdx_hy_5y",
-        file_path=DATA_DIR / "raw" / "cdx_hy_5y.parquet",
-        instrument="CDX.NA.HY",
-        tenor="5Y",
-        metadata={"source": "synthetic", "frequency": "daily"},
-    )
-
-    # Register market data
-    registry.register_dataset(
-        name="vix",
-        file_path=DATA_DIR / "raw" / "vix.parquet",
-        instrument="VIX",
-        metadata={"source": "synthetic", "frequency": "daily"},
-    )
-
-    registry.register_dataset(
-        name="hyg_etf",
-        file_path=DATA_DIR / "raw" / "hyg_etf.parquet",
-        instrument="HYG",
-        metadata={"source": "synthetic", "frequency": "daily", "type": "ETF"},
-    )
+    # Batch registrations so the registry file is written once
+    with registry.batch():
+        # Register CDX instruments
+        registry.register_dataset(
+            name="cdx_ig_5y",
+            file_path=DATA_DIR / "raw" / "cdx_ig_5y.parquet",
+            instrument="CDX.NA.IG",
+            tenor="5Y",
+            metadata={"source": "synthetic", "frequency": "daily"},
+        )
+
+        registry.register_dataset(
+            name="cdx_hy_5y",
+            file_path=DATA_DIR / "raw" / "cdx_hy_5y.parquet",
+            instrument="CDX.NA.HY",
+            tenor="5Y",
+            metadata={"source": "synthetic", "frequency": "daily"},
+        )
+
+        # Register market data
+        registry.register_dataset(
+            name="vix",
+            file_path=DATA_DIR / "raw" / "vix.parquet",
+            instrument="VIX",
+            metadata={"source": "synthetic", "frequency": "daily"},
+        )
+
+        registry.register_dataset(
+            name="hyg_etf",
+            file_path=DATA_DIR / "raw" / "hyg_etf.parquet",
+            instrument="HYG",
+            metadata={"source": "synthetic", "frequency": "daily", "type": "ETF"},
+        )
 
     print(f"  ✓ Registered {len(registry.list_datasets())} datasets")
 
 
-def demonstrate_registry_usage() -> None:
+def demonstrate_registry_usage(registry: DataRegistry) -> None:
     """Demonstrate registry query and filtering capabilities."""
     print("\nDemonstrating registry queries...")
 
-    registry = DataRegistry(REGISTRY_PATH, DATA_DIR)
-
     # List all datasets
     all_datasets = registry.list_datasets()
     print(f"  Total datasets: {len(all_datasets)}")
 
     # Filter by CDX instruments
-    cdx_datasets = [d for d in all_datasets if "cdx" in d]
+    cdx_datasets = registry.list_datasets(instrument_prefix="CDX")
     print(f"  CDX instruments: {cdx_datasets}")
 
     # Get detailed info using type-safe dataclass
@@ -153,19 +159,16 @@ def demonstrate_data_loading() -> None:
     cdx_ig = load_parquet(DATA_DIR / "raw" / "cdx_ig_5y.parquet")
     print(f"  Loaded full CDX IG dataset: {len(cdx_ig)} rows")
 
-    # Load with date filter
-    recent = load_parquet(
+    # Load one column for a date range in a single scan (projection + filter)
+    recent_spreads = load_parquet(
         DATA_DIR / "raw" / "cdx_ig_5y.parquet",
+        columns=["spread"],
         start_date=pd.Timestamp("2024-10-01"),
     )
-    print(f"  Loaded recent data (Oct 2024): {len(recent)} rows")
-
-    # Load specific columns
-    spreads_only = load_parquet(
-        DATA_DIR / "raw" / "cdx_ig_5y.parquet",
-        columns=["spread"],
+    print(
+        f"  Loaded recent data (Oct 2024): {len(recent_spreads)} rows, "
+        f"columns={recent_spreads.columns.tolist()}"
     )
-    print(f"  Loaded spread column only: {spreads_only.columns.tolist()}")
 
 
 def save_run_metadata() -> None:
@@ -184,7 +187,6 @@ def save_run_metadata() -> None:
         "output_path": DATA_DIR / "processed" / "signals.parquet",
     }
 
-    from aponyx.config import LOGS_DIR
     output_path = save_json(metadata, LOGS_DIR / "run_metadata.json")
     print(f"  ✓ Saved metadata to {output_path}")
 
@@ -193,17 +195,19 @@ def save_run_metadata() -> None:
     print(f"  ✓ Verified: Run ID = {loaded['run_id']}")
 
 
-def demonstrate_dataclass_features() -> None:
+def demonstrate_dataclass_features(registry: DataRegistry) -> None:
     """Demonstrate DatasetEntry dataclass features."""
     print("\nDemonstrating DatasetEntry dataclass...")
     
-    registry = DataRegistry(REGISTRY_PATH, DATA_DIR)
-    
     # Get multiple entries and work with them type-safely
     print("\n  Processing multiple datasets:")
-    for name in ["cdx_ig_5y", "cdx_hy_5y", "vix"]:
-        entry = registry.get_dataset_entry(name)
-        print(f"    {entry.instrument:12s} ({entry.tenor or 'N/A':3s}): {entry.row_count:3d} rows")
+    entries = registry.get_many(["cdx_ig_5y", "cdx_hy_5y", "vix"])
+    print(
+        "\n".join(
+            f"    {e.instrument:12s} ({e.tenor or 'N/A':3s}): {e.row_count:3d} rows"
+            for e in entries
+        )
+    )
     
     # Demonstrate conversion methods
     print("\n  Dataclass conversion methods:")
@@ -223,8 +227,7 @@ def demonstrate_dataclass_features() -> None:
     all_names = registry.list_datasets()
     large_datasets = [
         name for name in all_names
-        if registry.get_dataset_entry(name).row_count and 
-           registry.get_dataset_entry(name).row_count > 100
+        if (registry.get_dataset_entry(name).row_count or 0) > 100
     ]
     print(f"    Datasets with >100 rows: {large_datasets}")
 
@@ -235,10 +238,14 @@ def main() -> None:
     print("Persistence Layer Demo")
     print("=" * 60)
 
+    ensure_directories()
     create_sample_data()
-    register_datasets()
-    demonstrate_registry_usage()
-    demonstrate_dataclass_features()
+
+    # One registry instance shared by all steps (parsed from disk once)
+    registry = DataRegistry(REGISTRY_PATH, DATA_DIR)
+    register_datasets(registry)
+    demonstrate_registry_usage(registry)
+    demonstrate_dataclass_features(registry)
     demonstrate_data_loading()
     save_run_metadata()
 
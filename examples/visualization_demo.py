@@ -5,6 +5,7 @@ Shows basic usage patterns for plotting equity curves, signals, and drawdowns.
 """
 
 import logging
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
@@ -20,29 +21,59 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def generate_sample_pnl(n_days: int = 252, seed: int = 42) -> pd.Series:
+@lru_cache(maxsize=8)
+def _make_index(n_days: int, end_day: pd.Timestamp) -> pd.DatetimeIndex:
+    """Build a daily DatetimeIndex ending on ``end_day`` (cached per day)."""
+    return pd.date_range(end=end_day, periods=n_days, freq="D")
+
+
+def sample_index(n_days: int = 252) -> pd.DatetimeIndex:
+    """
+    Daily DatetimeIndex of ``n_days`` ending today, shared across samples.
+
+    Parameters
+    ----------
+    n_days : int, default 252
+        Number of days in the index.
+
+    Returns
+    -------
+    pd.DatetimeIndex
+        Daily index ending at today's date (midnight).
+    """
+    return _make_index(n_days, pd.Timestamp.today().normalize())
+
+
+def generate_sample_pnl(
+    n_days: int = 252,
+    seed: int = 42,
+    index: pd.DatetimeIndex | None = None,
+) -> pd.Series:
     """
     Generate synthetic daily P&L for demonstration.
 
     Parameters
     ----------
     n_days : int, default 252
-        Number of trading days to simulate.
+        Number of trading days to simulate. Ignored if ``index`` is given.
     seed : int, default 42
         Random seed for reproducibility.
+    index : pd.DatetimeIndex | None
+        Dates to use. Defaults to ``sample_index(n_days)``.
 
     Returns
     -------
     pd.Series
         Daily P&L with DatetimeIndex.
     """
-    np.random.seed(seed)
-    dates = pd.date_range(end=pd.Timestamp.now(), periods=n_days, freq="D")
+    rng = np.random.default_rng(seed)
+    dates = sample_index(n_days) if index is None else index
+    n_days = len(dates)
 
     # Synthetic P&L with trend and volatility
     drift = 0.02
     vol = 1.5
-    returns = np.random.normal(drift, vol, n_days)
+    returns = rng.normal(drift, vol, n_days)
 
     # Add regime change midway
     returns[n_days // 2 : n_days // 2 + 50] -= 3
@@ -51,42 +82,52 @@ def generate_sample_pnl(n_days: int = 252, seed: int = 42) -> pd.Series:
     return pnl
 
 
-def generate_sample_signal(n_days: int = 252, seed: int = 42) -> pd.Series:
+def generate_sample_signal(
+    n_days: int = 252,
+    seed: int = 42,
+    index: pd.DatetimeIndex | None = None,
+) -> pd.Series:
     """
     Generate synthetic z-score signal for demonstration.
 
     Parameters
     ----------
     n_days : int, default 252
-        Number of observations.
+        Number of observations. Ignored if ``index`` is given.
     seed : int, default 42
         Random seed for reproducibility.
+    index : pd.DatetimeIndex | None
+        Dates to use. Defaults to ``sample_index(n_days)``.
 
     Returns
     -------
     pd.Series
         Z-score normalized signal.
     """
-    np.random.seed(seed)
-    dates = pd.date_range(end=pd.Timestamp.now(), periods=n_days, freq="D")
+    rng = np.random.default_rng(seed)
+    dates = sample_index(n_days) if index is None else index
+    n_days = len(dates)
 
     # Mean-reverting signal around zero
-    signal = np.random.normal(0, 1, n_days)
-    signal = pd.Series(signal, index=dates, name="momentum_signal")
+    raw = rng.standard_normal(n_days)
 
-    # Add autocorrelation
-    signal = signal.rolling(5).mean().fillna(0)
+    # Add autocorrelation: trailing 5-day mean (leading "full" convolution
+    # terms), zero until the first complete window
+    window = 5
+    smoothed = np.convolve(raw, np.full(window, 1.0 / window), mode="full")[:n_days]
+    smoothed[: window - 1] = 0.0
 
-    return signal
+    return pd.Series(smoothed, index=dates, name="momentum_signal")
 
 
 def demo_functional_interface() -> None:
     """Demonstrate functional plotting interface."""
     logger.info("=== Functional Interface Demo ===")
 
-    # Generate sample data
-    pnl = generate_sample_pnl()
-    signal = generate_sample_signal()
+    # Generate sample data on one shared date index
+    dates = sample_index(252)
+    pnl = generate_sample_pnl(index=dates)
+    signal = generate_sample_signal(index=dates)
 
     # Equity curve
     fig_equity = plot_equity_curve(
@@ -126,8 +167,9 @@ def demo_visualizer_class() -> None:
     viz = Visualizer(theme="plotly_white")
 
     # Generate sample data
-    pnl = generate_sample_pnl(n_days=365)
-    signal = generate_sample_signal(n_days=365)
+    dates = sample_index(365)
+    pnl = generate_sample_pnl(index=dates)
+    signal = generate_sample_signal(index=dates)
 
     # Use visualizer methods
     fig_equity = viz.equity_curve(
@@ -4,9 +4,18 @@ Aponyx - Systematic Macro Credit Strategy Framework.
 A modular Python framework for developing and backtesting systematic credit strategies.
 """
 
-from importlib.metadata import version
+from typing import Any
 
-__version__ = version("aponyx")
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``__version__`` lazily from installed package metadata."""
+    if name == "__version__":
+        from importlib.metadata import version
+
+        # Cache as a real module attribute so later lookups skip this hook
+        globals()["__version__"] = value = version("aponyx")
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def hello() -> str:
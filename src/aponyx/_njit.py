@@ -0,0 +1,49 @@
+"""
+Optional Numba JIT compilation for numeric kernels.
+
+Numba is an optional dependency (``pip install aponyx[perf]``). When it is
+not installed, ``njit`` degrades to a no-op decorator so kernels run as
+plain Python with identical results.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+try:
+    from numba import njit as _numba_njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """
+    Compile a function with ``numba.njit`` when Numba is available.
+
+    Supports both bare ``@njit`` and parameterized ``@njit(cache=True)``
+    usage. Without Numba, the decorated function is returned unchanged.
+
+    Parameters
+    ----------
+    *args : Any
+        Decorated function (bare usage) or positional Numba options.
+    **kwargs : Any
+        Numba compilation options (e.g., ``cache=True``).
+
+    Returns
+    -------
+    Any
+        Compiled dispatcher, original function, or a decorator.
+    """
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorator
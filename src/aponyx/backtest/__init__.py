@@ -10,11 +10,13 @@ Core Components
 - engine: Position generation and P&L simulation
 - metrics: Performance and risk statistics
 - config: Backtest parameters and constraints
+- parallel: Batch execution of independent backtests
 - protocols: Abstract interfaces for extensibility
 """
 
 from .config import BacktestConfig
-from .engine import run_backtest, BacktestResult
+from .engine import run_backtest, BacktestResult, position_change_mask
+from .parallel import run_backtest_grid, run_backtests_parallel
 from .metrics import compute_performance_metrics, PerformanceMetrics
 from .protocols import BacktestEngine, PerformanceCalculator
 
@@ -22,6 +24,9 @@ __all__ = [
     "BacktestConfig",
     "run_backtest",
     "BacktestResult",
+    "position_change_mask",
+    "run_backtests_parallel",
+    "run_backtest_grid",
     "compute_performance_metrics",
     "PerformanceMetrics",
     "BacktestEngine",
@@ -79,7 +79,7 @@ Usage
 #
 #         metadata = {
 #             "engine": "vectorbt",
-#             "config": config.__dict__,
+#             "config": dataclasses.asdict(config),  # slotted: no __dict__
 #             "summary": portfolio.stats().to_dict(),
 #         }
 #
@@ -5,7 +5,7 @@ Configuration for backtest engine.
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BacktestConfig:
     """
     Backtest parameters and trading constraints.
@@ -35,6 +35,8 @@ class BacktestConfig:
     - entry_threshold > exit_threshold creates hysteresis to reduce turnover.
     - Position sizing is deliberately simple for the pilot (binary on/off).
     - Transaction costs are applied symmetrically on entry and exit.
+    - Frozen and slotted: instances are immutable, have no ``__dict__``,
+      and read attributes through slot descriptors.
     """
 
     entry_threshold: float = 1.5
@@ -11,8 +11,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from .._njit import NUMBA_AVAILABLE, njit
 from .config import BacktestConfig
 
 logger = logging.getLogger(__name__)
@@ -28,8 +30,8 @@ class BacktestResult:
     positions : pd.DataFrame
         Daily position history with columns:
         - signal: signal value
-        - position: current position (+1, 0, -1)
-        - days_held: days in current position
+        - position: current position (+1, 0, -1), int8
+        - days_held: days in current position, int32
         - spread: CDX spread level (for P&L calc)
     pnl : pd.DataFrame
         Daily P&L breakdown with columns:
@@ -42,6 +44,9 @@ class BacktestResult:
 
     Notes
     -----
+    The narrow integer columns keep long histories compact; reductions
+    such as ``.sum()`` still promote to int64.
+
     This structure is designed to be easily convertible to formats
     expected by third-party backtest libraries (e.g., vectorbt).
     """
@@ -111,115 +116,86 @@ def run_backtest(
     if not isinstance(spread.index, pd.DatetimeIndex):
         raise ValueError("spread must have DatetimeIndex")
 
-    # Align data
-    aligned = pd.DataFrame(
-        {
-            "signal": composite_signal,
-            "spread": spread,
-        }
-    ).dropna()
-
-    if len(aligned) == 0:
-        raise ValueError("No valid data after alignment")
-
-    # Initialize tracking
-    positions = []
-    pnl_records = []
-    current_position = 0
-    days_held = 0
-    entry_spread = 0.0
-
-    for date, row in aligned.iterrows():
-        signal = row["signal"]
-        spread_level = row["spread"]
-
-        # Initialize cost tracking for this iteration
-        entry_cost = 0.0
-        exit_cost = 0.0
-
-        # Store position before any state changes (for P&L calculation)
-        position_before_update = current_position
-        entry_spread_before_update = entry_spread
-
-        # Determine position based on signal thresholds
-        if current_position == 0:
-            # Not in position - check entry conditions
-            if signal > config.entry_threshold:
-                current_position = 1  # Long credit risk (sell protection)
-                days_held = 0
-                entry_spread = spread_level
-                entry_cost = config.transaction_cost_bps * config.position_size * 100
-            elif signal < -config.entry_threshold:
-                current_position = -1  # Short credit risk (buy protection)
-                days_held = 0
-                entry_spread = spread_level
-                entry_cost = config.transaction_cost_bps * config.position_size * 100
-        else:
-            # In position - check exit conditions
-            days_held += 1
-
-            exit_signal = abs(signal) < config.exit_threshold
-            exit_time = (
-                config.max_holding_days is not None and days_held >= config.max_holding_days
-            )
+    # Align on common dates (no reindex when the inputs already share an
+    # index), then drop dates where either input is missing
+    if composite_signal.index.equals(spread.index):
+        dates = composite_signal.index
+        signal_values = composite_signal.to_numpy(dtype=np.float64, na_value=np.nan)
+        spread_values = spread.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        dates = composite_signal.index.intersection(spread.index)
+        if not dates.is_monotonic_increasing:
+            dates = dates.sort_values()
+        signal_values = composite_signal.reindex(dates).to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        spread_values = spread.reindex(dates).to_numpy(dtype=np.float64, na_value=np.nan)
 
-            if exit_signal or exit_time:
-                # Exit position (will apply exit cost and capture final P&L)
-                exit_cost = config.transaction_cost_bps * config.position_size * 100
-                current_position = 0
-                days_held = 0
+    valid = ~(np.isnan(signal_values) | np.isnan(spread_values))
+    if not valid.all():
+        dates = dates[valid]
+        signal_values = signal_values[valid]
+        spread_values = spread_values[valid]
 
-        # Calculate P&L based on position we held during this period
-        # Use position_before_update to capture P&L on exit day
-        if position_before_update != 0:
-            # Spread change: negative when tightening, positive when widening
-            spread_change = spread_level - entry_spread_before_update
-            # Long position profits from tightening (negative spread change)
-            # Short position profits from widening (positive spread change)
-            # P&L = -position * spread_change * DV01 * position_size
-            spread_pnl = (
-                -position_before_update
-                * spread_change
-                * config.dv01_per_million
-                * config.position_size
-            )
-        else:
-            spread_pnl = 0.0
+    if len(dates) == 0:
+        raise ValueError("No valid data after alignment")
 
-        total_cost = entry_cost + exit_cost
-        net_pnl = spread_pnl - total_cost
-
-        # Record position state
-        positions.append(
-            {
-                "date": date,
-                "signal": signal,
-                "position": current_position,
-                "days_held": days_held,
-                "spread": spread_level,
-            }
+    # Run state machine on contiguous float64 arrays so the compiled kernel
+    # sees one array type regardless of input dtype or layout
+    signal_arr = np.ascontiguousarray(signal_values)
+    spread_arr = np.ascontiguousarray(spread_values)
+
+    if config.max_holding_days is None and not NUMBA_AVAILABLE:
+        # Signal-driven exits only: array operations avoid the pure-Python
+        # loop (the compiled kernel is faster still when Numba is installed)
+        position, days_held, spread_pnl, cost, n_trades = _backtest_vectorized(
+            signal_arr,
+            spread_arr,
+            config.entry_threshold,
+            config.exit_threshold,
+            config.position_size,
+            config.dv01_per_million,
+            config.transaction_cost_bps,
         )
-
-        # Record P&L
-        pnl_records.append(
-            {
-                "date": date,
-                "spread_pnl": spread_pnl,
-                "cost": total_cost,
-                "net_pnl": net_pnl,
-            }
+    else:
+        max_holding_days = -1 if config.max_holding_days is None else config.max_holding_days
+        position, days_held, spread_pnl, cost, n_trades = _backtest_loop(
+            signal_arr,
+            spread_arr,
+            config.entry_threshold,
+            config.exit_threshold,
+            max_holding_days,
+            config.position_size,
+            config.dv01_per_million,
+            config.transaction_cost_bps,
         )
 
+    net_pnl = spread_pnl - cost
+    cumulative_pnl = np.cumsum(net_pnl)
+
     # Convert to DataFrames
-    positions_df = pd.DataFrame(positions).set_index("date")
-    pnl_df = pd.DataFrame(pnl_records).set_index("date")
-    pnl_df["cumulative_pnl"] = pnl_df["net_pnl"].cumsum()
-
-    # Calculate summary statistics (count round-trip trades: entries only)
-    prev_position = positions_df["position"].shift(1).fillna(0)
-    position_entries = (prev_position == 0) & (positions_df["position"] != 0)
-    n_trades = position_entries.sum()
-    total_pnl = pnl_df["cumulative_pnl"].iloc[-1]
+    index = pd.DatetimeIndex(dates, freq=None, name="date")
+    positions_df = pd.DataFrame(
+        {
+            "signal": signal_arr,
+            "position": position,
+            "days_held": days_held,
+            "spread": spread_arr,
+        },
+        index=index,
+    )
+    pnl_df = pd.DataFrame(
+        {
+            "spread_pnl": spread_pnl,
+            "cost": cost,
+            "net_pnl": net_pnl,
+            "cumulative_pnl": cumulative_pnl,
+        },
+        index=index,
+    )
+
+    # Calculate summary statistics (n_trades counts round trips: entries only)
+    total_pnl = cumulative_pnl[-1]
     avg_pnl_per_trade = total_pnl / n_trades if n_trades > 0 else 0.0
 
     metadata = {
@@ -233,9 +209,9 @@ def run_backtest(
             "dv01_per_million": config.dv01_per_million,
         },
         "summary": {
-            "start_date": str(aligned.index[0]),
-            "end_date": str(aligned.index[-1]),
-            "total_days": len(aligned),
+            "start_date": str(dates[0]),
+            "end_date": str(dates[-1]),
+            "total_days": len(dates),
             "n_trades": int(n_trades),
             "total_pnl": float(total_pnl),
             "avg_pnl_per_trade": float(avg_pnl_per_trade),
@@ -254,3 +230,209 @@ def run_backtest(
         pnl=pnl_df,
         metadata=metadata,
     )
+
+
+def position_change_mask(positions: pd.DataFrame) -> np.ndarray:
+    """
+    Flag dates where the position differs from the previous date.
+
+    Parameters
+    ----------
+    positions : pd.DataFrame
+        Position history with a 'position' column (e.g., ``BacktestResult.positions``).
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask aligned with ``positions`` rows. The first row is
+        compared against a flat starting position.
+
+    Examples
+    --------
+    >>> mask = position_change_mask(result.positions)
+    >>> trades = result.positions.iloc[mask]
+    """
+    position = positions["position"].to_numpy()
+    mask = np.empty(len(position), dtype=bool)
+    if len(position) > 0:
+        mask[0] = position[0] != 0
+        np.not_equal(position[1:], position[:-1], out=mask[1:])
+    return mask
+
+
+def _backtest_vectorized(
+    signal: np.ndarray,
+    spread: np.ndarray,
+    entry_threshold: float,
+    exit_threshold: float,
+    position_size: float,
+    dv01_per_million: float,
+    transaction_cost_bps: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Compute the entry/exit state machine without a per-date loop.
+
+    Equivalent to ``_backtest_loop`` with ``max_holding_days=-1``; see that
+    function for parameters and returns.
+
+    Notes
+    -----
+    With no holding limit, every date with ``|signal| < exit_threshold``
+    ends flat: an open position exits, and no position can open because
+    ``entry_threshold > exit_threshold`` (enforced by ``BacktestConfig``).
+    These dates split the series into independent segments. Within a
+    segment, the first date with ``|signal| > entry_threshold`` opens a
+    position in the signal's direction, held until the segment ends.
+    """
+    n = signal.shape[0]
+    dates = np.arange(n)
+
+    exit_zone = np.abs(signal) < exit_threshold
+    segment = np.cumsum(exit_zone)
+    trigger = (signal > entry_threshold) | (signal < -entry_threshold)
+    trigger_count = np.cumsum(trigger)
+
+    # Number of entry triggers seen so far within each date's segment
+    segment_base = np.concatenate(([0], trigger_count[exit_zone]))
+    triggers_in_segment = trigger_count - segment_base[segment]
+    held = triggers_in_segment > 0
+    entry = trigger & (triggers_in_segment == 1)
+
+    n_segments = segment_base.shape[0]
+    segment_entry = np.zeros(n_segments, dtype=np.int64)
+    segment_direction = np.zeros(n_segments, dtype=np.int64)
+    segment_entry[segment[entry]] = dates[entry]
+    segment_direction[segment[entry]] = np.where(signal[entry] > 0, 1, -1)
+
+    entry_date = segment_entry[segment]
+    position = np.where(held, segment_direction[segment], 0).astype(np.int8)
+    days_held = np.where(held, dates - entry_date, 0).astype(np.int32)
+    entry_spread = np.where(held, spread[entry_date], 0.0)
+
+    # P&L uses the position held before each date's update (as in the loop)
+    prev_position = np.concatenate(([0], position[:-1]))
+    prev_entry_spread = np.concatenate(([0.0], entry_spread[:-1]))
+    spread_pnl = np.where(
+        prev_position != 0,
+        -prev_position * (spread - prev_entry_spread) * dv01_per_million * position_size,
+        0.0,
+    )
+    cost_per_trade = transaction_cost_bps * position_size * 100
+    cost = np.where(position != prev_position, cost_per_trade, 0.0)
+
+    return position, days_held, spread_pnl, cost, int(np.count_nonzero(entry))
+
+
+@njit(cache=True)
+def _backtest_loop(
+    signal: np.ndarray,
+    spread: np.ndarray,
+    entry_threshold: float,
+    exit_threshold: float,
+    max_holding_days: int,
+    position_size: float,
+    dv01_per_million: float,
+    transaction_cost_bps: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Run the entry/exit state machine over aligned signal and spread arrays.
+
+    Parameters
+    ----------
+    signal : np.ndarray
+        Signal values (float64), aligned with spread and free of NaN.
+    spread : np.ndarray
+        Spread levels (float64).
+    entry_threshold : float
+        Absolute signal level required to enter a position.
+    exit_threshold : float
+        Absolute signal level below which the position is closed.
+    max_holding_days : int
+        Maximum days to hold a position, or -1 for no limit.
+    position_size : float
+        Notional in millions.
+    dv01_per_million : float
+        DV01 per $1MM notional.
+    transaction_cost_bps : float
+        Round-trip cost in basis points, charged on entry and on exit.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]
+        Position (-1, 0, +1; int8), days held (int32), spread P&L and
+        transaction cost for each date, followed by the number of
+        position entries.
+
+    Notes
+    -----
+    Compiled with Numba when available; see ``aponyx._njit``.
+    P&L on each date uses the position held before that date's update,
+    so the exit day still captures the final spread move.
+    """
+    n = signal.shape[0]
+    position_out = np.empty(n, dtype=np.int8)
+    days_held_out = np.empty(n, dtype=np.int32)
+    spread_pnl_out = np.empty(n, dtype=np.float64)
+    cost_out = np.empty(n, dtype=np.float64)
+
+    # Charged on every entry and exit; computed once rather than per branch
+    cost_per_trade = transaction_cost_bps * position_size * 100
+
+    current_position = 0
+    days_held = 0
+    entry_spread = 0.0
+    n_entries = 0
+
+    for i in range(n):
+        signal_value = signal[i]
+        spread_level = spread[i]
+        cost = 0.0
+
+        # Store position before any state changes (for P&L calculation)
+        position_before_update = current_position
+        entry_spread_before_update = entry_spread
+
+        if current_position == 0:
+            # Not in position - check entry conditions
+            if signal_value > entry_threshold:
+                current_position = 1  # Long credit risk (sell protection)
+                days_held = 0
+                entry_spread = spread_level
+                cost = cost_per_trade
+                n_entries += 1
+            elif signal_value < -entry_threshold:
+                current_position = -1  # Short credit risk (buy protection)
+                days_held = 0
+                entry_spread = spread_level
+                cost = cost_per_trade
+                n_entries += 1
+        else:
+            # In position - check exit conditions
+            days_held += 1
+
+            exit_signal = abs(signal_value) < exit_threshold
+            exit_time = max_holding_days >= 0 and days_held >= max_holding_days
+
+            if exit_signal or exit_time:
+                cost = cost_per_trade
+                current_position = 0
+                days_held = 0
+
+        # Long position profits from tightening (negative spread change)
+        # P&L = -position * spread_change * DV01 * position_size
+        if position_before_update != 0:
+            spread_pnl = (
+                -position_before_update
+                * (spread_level - entry_spread_before_update)
+                * dv01_per_million
+                * position_size
+            )
+        else:
+            spread_pnl = 0.0
+
+        position_out[i] = current_position
+        days_held_out[i] = days_held
+        spread_pnl_out[i] = spread_pnl
+        cost_out[i] = cost
+
+    return position_out, days_held_out, spread_pnl_out, cost_out, n_entries
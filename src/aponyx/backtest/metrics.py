@@ -150,27 +150,26 @@ def compute_performance_metrics(
 
     # Trade-level statistics
     # Identify trade entries (transitions from flat to positioned)
-    prev_position = positions_df["position"].shift(1).fillna(0)
-    position_entries = (prev_position == 0) & (positions_df["position"] != 0)
-    n_trades = position_entries.sum()
+    position = positions_df["position"].to_numpy()
+    prev_position = positions_df["position"].shift(1).fillna(0).to_numpy()
+    position_entries = (prev_position == 0) & (position != 0)
+    n_trades = np.count_nonzero(position_entries)
 
     # Compute P&L per trade by grouping consecutive positions
     # Assign a trade_id to each position period
-    position_changes = (positions_df["position"] != prev_position).astype(int)
-    trade_id = position_changes.cumsum()
-    
+    trade_id = np.cumsum(position != prev_position)
+
     # Only include periods where we have a position
-    active_trades = positions_df[positions_df["position"] != 0].copy()
-    
-    if len(active_trades) > 0:
-        active_trades["trade_id"] = trade_id[positions_df["position"] != 0]
-        
-        # Sum P&L per trade_id
-        trade_pnls = pnl_df.loc[active_trades.index].groupby(
-            active_trades["trade_id"]
-        )["net_pnl"].sum()
-        
-        trade_pnls_array = trade_pnls.values
+    active = position != 0
+
+    if active.any():
+        # Sum P&L per trade_id (positional, so duplicate dates are safe)
+        trade_pnls_array = (
+            pd.Series(pnl_df["net_pnl"].to_numpy()[active])
+            .groupby(trade_id[active])
+            .sum()
+            .to_numpy()
+        )
         winning_trades = trade_pnls_array[trade_pnls_array > 0]
         losing_trades = trade_pnls_array[trade_pnls_array < 0]
 
@@ -189,7 +188,7 @@ def compute_performance_metrics(
         win_loss_ratio = 0.0
 
     # Holding period statistics
-    holding_periods = positions_df[positions_df["position"] != 0]["days_held"]
+    holding_periods = positions_df["days_held"].to_numpy()[active]
     avg_holding_days = holding_periods.mean() if len(holding_periods) > 0 else 0.0
 
     logger.info(
@@ -0,0 +1,199 @@
+"""
+Parallel execution of independent backtests.
+
+Each backtest is pure CPU work on its own inputs, so a batch of them
+(e.g., a set of candidate signals or a parameter grid) can be spread
+across processes.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .config import BacktestConfig
+from .engine import BacktestResult, run_backtest
+
+logger = logging.getLogger(__name__)
+
+# Grid inputs attached from shared memory, one copy per worker process
+_shared_inputs: dict[str, Any] = {}
+
+
+def run_backtests_parallel(
+    signals: list[pd.Series],
+    spread: pd.Series,
+    config: BacktestConfig | None = None,
+    max_workers: int | None = None,
+) -> list[BacktestResult]:
+    """
+    Run one backtest per signal against a shared spread series.
+
+    Parameters
+    ----------
+    signals : list[pd.Series]
+        Signals to backtest, each with a DatetimeIndex.
+    spread : pd.Series
+        CDX spread levels used for P&L in every backtest.
+    config : BacktestConfig | None
+        Backtest parameters shared by all runs. Uses defaults if None.
+    max_workers : int | None
+        Number of worker processes. Defaults to one per signal, capped
+        at the CPU count.
+
+    Returns
+    -------
+    list[BacktestResult]
+        Results in the same order as ``signals``.
+
+    Notes
+    -----
+    Runs serially in the calling process when there is only one signal
+    or ``max_workers == 1``, avoiding process start-up cost. Workers are
+    started with the ``spawn`` method, so scripts calling this function
+    need an ``if __name__ == "__main__":`` guard.
+
+    Examples
+    --------
+    >>> results = run_backtests_parallel([basis, gap], cdx_df["spread"], config)
+    >>> [r.metadata["summary"]["total_pnl"] for r in results]
+    """
+    if config is None:
+        config = BacktestConfig()
+
+    if len(signals) <= 1 or max_workers == 1:
+        return [run_backtest(signal, spread, config) for signal in signals]
+
+    n_workers = max_workers or min(len(signals), os.cpu_count() or 1)
+    logger.info("Running %d backtests across %d processes", len(signals), n_workers)
+
+    # Spawn (not fork): the parent may already hold Arrow/Numba worker threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+        futures = [
+            executor.submit(run_backtest, signal, spread, config) for signal in signals
+        ]
+        return [future.result() for future in futures]
+
+
+def run_backtest_grid(
+    composite_signal: pd.Series,
+    spread: pd.Series,
+    configs: list[BacktestConfig],
+    max_workers: int | None = None,
+) -> list[BacktestResult]:
+    """
+    Run one backtest per config against a shared signal and spread.
+
+    Parameters
+    ----------
+    composite_signal : pd.Series
+        Signal used in every backtest, with a DatetimeIndex.
+    spread : pd.Series
+        CDX spread levels used for P&L, with a DatetimeIndex.
+    configs : list[BacktestConfig]
+        Parameter sets to evaluate (e.g., an entry/exit threshold grid).
+    max_workers : int | None
+        Number of worker processes. Defaults to one per config, capped
+        at the CPU count.
+
+    Returns
+    -------
+    list[BacktestResult]
+        Results in the same order as ``configs``.
+
+    Raises
+    ------
+    ValueError
+        If either input lacks a DatetimeIndex.
+
+    Notes
+    -----
+    The signal and spread are copied once into a shared memory block that
+    every worker maps on start-up, instead of being pickled for each
+    config. Values are shared as float64, which is what ``run_backtest``
+    computes on. Runs serially for a single config or ``max_workers == 1``.
+
+    Examples
+    --------
+    >>> configs = [BacktestConfig(entry_threshold=t) for t in (1.0, 1.5, 2.0)]
+    >>> results = run_backtest_grid(composite_signal, cdx_df["spread"], configs)
+    """
+    if len(configs) <= 1 or max_workers == 1:
+        return [run_backtest(composite_signal, spread, config) for config in configs]
+
+    if not isinstance(composite_signal.index, pd.DatetimeIndex):
+        raise ValueError("composite_signal must have DatetimeIndex")
+    if not isinstance(spread.index, pd.DatetimeIndex):
+        raise ValueError("spread must have DatetimeIndex")
+
+    n_workers = max_workers or min(len(configs), os.cpu_count() or 1)
+    logger.info("Running %d backtest configs across %d processes", len(configs), n_workers)
+
+    arrays = [
+        composite_signal.index.as_unit("ns").asi8,
+        composite_signal.to_numpy(dtype=np.float64, na_value=np.nan),
+        spread.index.as_unit("ns").asi8,
+        spread.to_numpy(dtype=np.float64, na_value=np.nan),
+    ]
+    shm = SharedMemory(create=True, size=max(sum(a.nbytes for a in arrays), 1))
+    try:
+        # (dtype, length, byte offset) of each array inside the block
+        layout = []
+        offset = 0
+        for array in arrays:
+            np.ndarray(array.shape, array.dtype, buffer=shm.buf, offset=offset)[:] = array
+            layout.append((array.dtype.str, len(array), offset))
+            offset += array.nbytes
+
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=context,
+            initializer=_attach_shared_inputs,
+            initargs=(shm.name, layout, composite_signal.index.tz, spread.index.tz),
+        ) as executor:
+            return list(executor.map(_run_shared_backtest, configs))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _attach_shared_inputs(
+    name: str,
+    layout: list[tuple[str, int, int]],
+    signal_tz: Any,
+    spread_tz: Any,
+) -> None:
+    """Map the grid inputs from shared memory into this worker process."""
+    # Spawned workers share the parent's resource tracker, so attaching
+    # here does not take ownership; the parent unlinks the block
+    shm = SharedMemory(name=name)
+
+    signal_dates, signal_values, spread_dates, spread_values = (
+        np.ndarray((length,), np.dtype(dtype), buffer=shm.buf, offset=offset)
+        for dtype, length, offset in layout
+    )
+    _shared_inputs["shm"] = shm
+    _shared_inputs["signal"] = pd.Series(
+        signal_values, index=_dates_from_i8(signal_dates, signal_tz), copy=False
+    )
+    _shared_inputs["spread"] = pd.Series(
+        spread_values, index=_dates_from_i8(spread_dates, spread_tz), copy=False
+    )
+
+
+def _dates_from_i8(values: np.ndarray, tz: Any) -> pd.DatetimeIndex:
+    """Rebuild a DatetimeIndex from UTC nanosecond epochs."""
+    dates = pd.DatetimeIndex(values.view("M8[ns]"))
+    return dates if tz is None else dates.tz_localize("UTC").tz_convert(tz)
+
+
+def _run_shared_backtest(config: BacktestConfig) -> BacktestResult:
+    """Run one grid backtest on the worker's shared inputs."""
+    return run_backtest(_shared_inputs["signal"], _shared_inputs["spread"], config)
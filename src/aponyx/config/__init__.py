@@ -65,6 +65,12 @@ def ensure_directories() -> None:
 
     Creates data, logs, and other necessary directories for the project.
     Safe to call multiple times.
+
+    Notes
+    -----
+    Not run on import. Persistence writers create their own parent
+    directories, so call this only where the full project layout is
+    needed up front (e.g., example scripts).
     """
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
@@ -72,6 +78,3 @@ def ensure_directories() -> None:
     (DATA_DIR / "processed").mkdir(exist_ok=True)
     (DATA_DIR / "cache").mkdir(exist_ok=True)
 
-
-# Initialize directories on module import
-ensure_directories()
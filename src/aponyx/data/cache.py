@@ -14,7 +14,7 @@ import pandas as pd
 
 from ..persistence.parquet_io import save_parquet, load_parquet
 from ..persistence.registry import DataRegistry
-from .sources import DataSource, resolve_provider
+from .sources import APISource, DataSource, FileSource, resolve_provider
 
 logger = logging.getLogger(__name__)
 
@@ -47,9 +47,10 @@ def _generate_cache_key(
     str
         Hash-based cache key.
     """
-    # Create stable string representation
+    # Create stable string representation (source identity distinguishes files)
     key_parts = [
         resolve_provider(source),
+        _source_identity(source),
         instrument,
         start_date or "none",
         end_date or "none",
@@ -62,6 +63,29 @@ def _generate_cache_key(
     return hash_obj.hexdigest()[:16]
 
 
+def _source_identity(source: DataSource) -> str:
+    """
+    Describe a data source independently of path spelling and platform.
+
+    Parameters
+    ----------
+    source : DataSource
+        Data source configuration.
+
+    Returns
+    -------
+    str
+        Source type name plus its identifying fields. File paths are
+        resolved to absolute POSIX form, so relative and absolute paths to
+        the same file give the same identity on every OS.
+    """
+    if isinstance(source, FileSource):
+        return f"FileSource:{Path(source.path).resolve().as_posix()}"
+    if isinstance(source, APISource):
+        return f"APISource:{source.endpoint}|{sorted((source.params or {}).items())}"
+    return type(source).__name__
+
+
 def get_cache_path(
     cache_dir: Path,
     provider: str,
@@ -86,9 +110,13 @@ def get_cache_path(
     -------
     Path
         Path to cache file.
+
+    Notes
+    -----
+    Does not touch the filesystem. The provider directory is created by
+    ``save_parquet`` when data is first written to the cache.
     """
     provider_dir = cache_dir / provider
-    provider_dir.mkdir(parents=True, exist_ok=True)
 
     # Sanitize instrument name for filename
     safe_instrument = instrument.replace(".", "_").replace("/", "_")
@@ -177,7 +205,8 @@ def get_cached_data(
         return None
 
     logger.info("Cache hit: %s", cache_path.name)
-    return load_parquet(cache_path)
+    # Repeat hits on the same file version reuse the in-process table cache
+    return load_parquet(cache_path, cache=True)
 
 
 def save_to_cache(
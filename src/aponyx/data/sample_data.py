@@ -6,16 +6,64 @@ with configurable volatility, correlation, and trend parameters.
 """
 
 import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 import pandas as pd
 
-from ..persistence.parquet_io import save_parquet
+from .._njit import njit
+from ..persistence.json_io import load_json, save_json
+from ..persistence.parquet_io import save_parquet, save_parquet_row_groups
 from .sources import FileSource
 
 logger = logging.getLogger(__name__)
 
+@njit(cache=True)
+def _mean_reverting_path(
+    start: float,
+    mean_level: float,
+    speed: float,
+    shocks: np.ndarray,
+    floor: float,
+) -> np.ndarray:
+    """
+    Step a floored mean-reverting (AR(1)) process over pre-drawn shocks.
+
+    Parameters
+    ----------
+    start : float
+        Initial level.
+    mean_level : float
+        Long-run level the process reverts to.
+    speed : float
+        Fraction of the gap to ``mean_level`` closed each step.
+    shocks : np.ndarray
+        Additive shock for each step after the first observation.
+    floor : float
+        Lower bound applied after every step.
+
+    Returns
+    -------
+    np.ndarray
+        Path of length ``len(shocks) + 1`` starting at ``start``.
+
+    Notes
+    -----
+    Compiled with Numba when available; see ``aponyx._njit``. The floor
+    makes the recursion non-linear, so it cannot be written as a
+    cumulative sum.
+    """
+    path = np.empty(shocks.shape[0] + 1)
+    path[0] = start
+    for t in range(shocks.shape[0]):
+        drift = speed * (mean_level - path[t])
+        path[t + 1] = max(floor, path[t] + drift + shocks[t])
+    return path
+
 
 def generate_cdx_sample(
     start_date: str = "2024-01-01",
@@ -68,15 +116,8 @@ def generate_cdx_sample(
     dates = pd.date_range(start_date, periods=periods, freq="D")
 
     # Mean-reverting spread dynamics
-    spread = [base_spread]
-    mean_reversion_speed = 0.1
-    mean_level = base_spread
-
-    for _ in range(periods - 1):
-        drift = mean_reversion_speed * (mean_level - spread[-1])
-        shock = rng.normal(0, volatility)
-        new_spread = max(1.0, spread[-1] + drift + shock)
-        spread.append(new_spread)
+    shocks = rng.normal(0, volatility, periods - 1)
+    spread = _mean_reverting_path(base_spread, base_spread, 0.1, shocks, 1.0)
 
     df = pd.DataFrame(
         {
@@ -130,22 +171,11 @@ def generate_vix_sample(
     rng = np.random.default_rng(seed)
     dates = pd.date_range(start_date, periods=periods, freq="D")
 
-    # Mean-reverting VIX with spike potential
-    vix_close = [base_vix]
-    mean_reversion_speed = 0.15
-    mean_level = base_vix
-
-    for i in range(periods - 1):
-        # Occasional spike (5% probability)
-        if rng.random() < 0.05:
-            spike = rng.uniform(5, 15)
-        else:
-            spike = 0
-
-        drift = mean_reversion_speed * (mean_level - vix_close[-1])
-        shock = rng.normal(0, volatility)
-        new_vix = max(8.0, vix_close[-1] + drift + shock + spike)
-        vix_close.append(new_vix)
+    # Mean-reverting VIX with occasional spikes (5% probability)
+    spike_days = rng.random(periods - 1) < 0.05
+    spikes = np.where(spike_days, rng.uniform(5, 15, periods - 1), 0.0)
+    shocks = rng.normal(0, volatility, periods - 1)
+    vix_close = _mean_reverting_path(base_vix, base_vix, 0.15, shocks + spikes, 8.0)
 
     df = pd.DataFrame(
         {
@@ -215,11 +245,75 @@ def generate_etf_sample(
     return df
 
 
+def _run_sample_jobs(
+    jobs: dict[str, tuple[Callable[..., pd.DataFrame], dict[str, Any]]],
+    start_date: str,
+    periods: int,
+    max_workers: int | None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Run independent sample generators, optionally across processes.
+
+    Parameters
+    ----------
+    jobs : dict[str, tuple[Callable[..., pd.DataFrame], dict[str, Any]]]
+        Generator function and keyword arguments per output name.
+    start_date : str
+        Start date passed to every generator.
+    periods : int
+        Number of observations passed to every generator.
+    max_workers : int | None
+        Number of worker processes. None or 1 runs serially.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        Generated samples keyed like ``jobs``.
+
+    Notes
+    -----
+    Each generator seeds its own RNG, so results are identical whether
+    run serially or across processes.
+    """
+    if max_workers is None or max_workers <= 1:
+        return {
+            name: func(start_date=start_date, periods=periods, **kwargs)
+            for name, (func, kwargs) in jobs.items()
+        }
+
+    n_workers = min(len(jobs), max_workers)
+    logger.info(
+        "Generating %d samples across %d processes: periods=%d", len(jobs), n_workers, periods
+    )
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+        futures = {
+            name: executor.submit(func, start_date=start_date, periods=periods, **kwargs)
+            for name, (func, kwargs) in jobs.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _file_stamps(file_paths: dict[str, str]) -> dict[str, list[int] | None]:
+    """Return [size, mtime_ns] per file, or None for missing files."""
+    stamps: dict[str, list[int] | None] = {}
+    for key, path in file_paths.items():
+        try:
+            stat = Path(path).stat()
+        except FileNotFoundError:
+            stamps[key] = None
+        else:
+            stamps[key] = [stat.st_size, stat.st_mtime_ns]
+    return stamps
+
+
 def generate_full_sample_dataset(
     output_dir: str = "data/raw",
     start_date: str = "2023-01-01",
     periods: int = 252,
     seed: int = 42,
+    overwrite: bool = False,
+    max_workers: int | None = None,
 ) -> dict[str, str]:
     """
     Generate complete sample dataset for testing.
@@ -234,6 +328,11 @@ def generate_full_sample_dataset(
         Number of daily observations.
     seed : int, default 42
         Random seed for reproducibility.
+    overwrite : bool, default False
+        Regenerate files even if a manifest for the same arguments exists.
+    max_workers : int | None, default None
+        Number of worker processes for generating the five series. None
+        or 1 generates serially in the calling process.
 
     Returns
     -------
@@ -247,68 +346,69 @@ def generate_full_sample_dataset(
     - CDX HY 5Y spreads
     - VIX volatility
     - HYG and LQD ETF prices
+
+    Output is deterministic in (start_date, periods, seed). Every write
+    overwrites one manifest per output directory recording those arguments
+    and the size and mtime of each file. Later calls with the same
+    arguments return the recorded paths without regenerating, as long as
+    every file is unchanged since it was written.
+
+    Output does not depend on ``max_workers``. Process workers are started
+    with the ``spawn`` method, so scripts passing ``max_workers > 1`` need
+    an ``if __name__ == "__main__":`` guard. Worker start-up costs more
+    than generation itself unless series are long (tens of thousands of
+    periods).
     """
-    from pathlib import Path
+    output_path = Path(output_dir)
+    manifest_path = output_path / ".manifest.json"
+    args = {"start_date": start_date, "periods": periods, "seed": seed}
+
+    if not overwrite and manifest_path.exists():
+        manifest = load_json(manifest_path)
+        file_paths = manifest["file_paths"]
+        if manifest["args"] == args and manifest["files"] == _file_stamps(file_paths):
+            logger.info("Sample dataset up to date: manifest=%s", manifest_path)
+            return file_paths
 
     logger.info("Generating full sample dataset: output_dir=%s", output_dir)
 
-    output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Generate CDX data (multiple indices)
-    cdx_ig = generate_cdx_sample(
-        start_date=start_date,
-        periods=periods,
-        index_name="CDX_IG",
-        tenor="5Y",
-        base_spread=70.0,
-        volatility=3.0,
-        seed=seed,
-    )
-
-    cdx_hy = generate_cdx_sample(
-        start_date=start_date,
-        periods=periods,
-        index_name="CDX_HY",
-        tenor="5Y",
-        base_spread=350.0,
-        volatility=15.0,
-        seed=seed + 1,
-    )
+    # Independent generators (own seeds, no shared state)
+    jobs = {
+        "cdx_ig": (
+            generate_cdx_sample,
+            dict(index_name="CDX_IG", tenor="5Y", base_spread=70.0, volatility=3.0, seed=seed),
+        ),
+        "cdx_hy": (
+            generate_cdx_sample,
+            dict(
+                index_name="CDX_HY", tenor="5Y", base_spread=350.0, volatility=15.0, seed=seed + 1
+            ),
+        ),
+        "vix": (generate_vix_sample, dict(base_vix=16.0, seed=seed + 2)),
+        "hyg": (
+            generate_etf_sample,
+            dict(ticker="HYG", base_price=75.0, volatility=0.6, seed=seed + 3),
+        ),
+        "lqd": (
+            generate_etf_sample,
+            dict(ticker="LQD", base_price=110.0, volatility=0.4, seed=seed + 4),
+        ),
+    }
+    samples = _run_sample_jobs(jobs, start_date, periods, max_workers)
 
-    cdx_all = pd.concat([cdx_ig, cdx_hy], ignore_index=True)
+    # Write CDX indices into one file, one row group per index
     cdx_path = output_path / "cdx_spreads.parquet"
-    save_parquet(cdx_all, cdx_path)
+    save_parquet_row_groups([samples["cdx_ig"], samples["cdx_hy"]], cdx_path)
 
-    # Generate VIX data
-    vix = generate_vix_sample(
-        start_date=start_date, periods=periods, base_vix=16.0, seed=seed + 2
-    )
+    # Save VIX data
     vix_path = output_path / "vix.parquet"
-    save_parquet(vix, vix_path)
-
-    # Generate ETF data (multiple tickers)
-    hyg = generate_etf_sample(
-        start_date=start_date,
-        periods=periods,
-        ticker="HYG",
-        base_price=75.0,
-        volatility=0.6,
-        seed=seed + 3,
-    )
-
-    lqd = generate_etf_sample(
-        start_date=start_date,
-        periods=periods,
-        ticker="LQD",
-        base_price=110.0,
-        volatility=0.4,
-        seed=seed + 4,
-    )
+    save_parquet(samples["vix"], vix_path)
 
-    etf_all = pd.concat([hyg, lqd], ignore_index=True)
+    # Write ETF tickers into one file, one row group per ticker
     etf_path = output_path / "etf_prices.parquet"
-    save_parquet(etf_all, etf_path)
+    save_parquet_row_groups([samples["hyg"], samples["lqd"]], etf_path)
 
     file_paths = {
         "cdx": str(cdx_path),
@@ -316,6 +416,11 @@ def generate_full_sample_dataset(
         "etf": str(etf_path),
     }
 
+    save_json(
+        {"args": args, "file_paths": file_paths, "files": _file_stamps(file_paths)},
+        manifest_path,
+    )
+
     logger.info("Sample dataset generated: %s", file_paths)
     return file_paths
 
@@ -325,6 +430,7 @@ def generate_full_sample_sources(
     start_date: str = "2023-01-01",
     periods: int = 252,
     seed: int = 42,
+    overwrite: bool = False,
 ) -> dict[str, FileSource]:
     """
     Generate complete sample dataset and return FileSource configs.
@@ -339,6 +445,8 @@ def generate_full_sample_sources(
         Number of daily observations.
     seed : int, default 42
         Random seed for reproducibility.
+    overwrite : bool, default False
+        Regenerate files even if they are already up to date.
 
     Returns
     -------
@@ -350,7 +458,9 @@ def generate_full_sample_sources(
     Convenience wrapper around generate_full_sample_dataset that returns
     FileSource objects ready to use with fetch functions.
     """
-    file_paths = generate_full_sample_dataset(output_dir, start_date, periods, seed)
+    file_paths = generate_full_sample_dataset(
+        output_dir, start_date, periods, seed, overwrite=overwrite
+    )
 
     return {
         "cdx": FileSource(Path(file_paths["cdx"])),
@@ -6,6 +6,7 @@ Validates schema compliance, data types, and business logic constraints.
 
 import logging
 
+import numpy as np
 import pandas as pd
 
 from .schemas import CDXSchema, VIXSchema, ETFSchema
@@ -20,7 +21,7 @@ def _ensure_datetime_index(df: pd.DataFrame, date_col: str) -> pd.DataFrame:
     Parameters
     ----------
     df : pd.DataFrame
-        DataFrame to process.
+        DataFrame to process. Never modified in place.
     date_col : str
         Name of date column to use as index.
 
@@ -28,16 +29,23 @@ def _ensure_datetime_index(df: pd.DataFrame, date_col: str) -> pd.DataFrame:
     -------
     pd.DataFrame
         DataFrame with DatetimeIndex, sorted by date.
+
+    Notes
+    -----
+    ``set_index`` already returns a new frame, so the input is left
+    untouched without a defensive copy, and ``pd.to_datetime`` is skipped
+    when the date column already has a datetime dtype.
     """
     if not isinstance(df.index, pd.DatetimeIndex):
-        df = df.copy()
-        df[date_col] = pd.to_datetime(df[date_col])
+        already_datetime = pd.api.types.is_datetime64_any_dtype(df[date_col])
         df = df.set_index(date_col)
-    
+        if not already_datetime:
+            df.index = pd.to_datetime(df.index)
+
     return df.sort_index()
 
 
-def _check_duplicate_dates(df: pd.DataFrame, context: str = "") -> None:
+def _check_duplicate_dates(df: pd.DataFrame, context: str = "") -> np.ndarray:
     """
     Check for and log duplicate dates in DataFrame index.
 
@@ -47,13 +55,71 @@ def _check_duplicate_dates(df: pd.DataFrame, context: str = "") -> None:
         DataFrame with DatetimeIndex to check.
     context : str, optional
         Additional context for log message (e.g., ticker name).
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask marking repeat occurrences of a date (first kept).
+    """
+    # Index uniqueness is cached by pandas, so clean data skips the mask
+    if not df.index.has_duplicates:
+        return np.zeros(len(df), dtype=bool)
+
+    duplicated = df.index.duplicated()
+    n_dups = int(np.count_nonzero(duplicated))
+    if context:
+        logger.warning("Found %d duplicate dates for %s", n_dups, context)
+    else:
+        logger.warning("Found %d duplicate dates", n_dups)
+    return duplicated
+
+
+def _validate_bounds(
+    df: pd.DataFrame,
+    col: str,
+    lower: float,
+    upper: float,
+    label: str,
+) -> None:
+    """
+    Check that a column lies within inclusive bounds.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame to check.
+    col : str
+        Column to validate.
+    lower : float
+        Inclusive lower bound.
+    upper : float
+        Inclusive upper bound.
+    label : str
+        Value description for messages (e.g., "spread", "VIX").
+
+    Raises
+    ------
+    ValueError
+        If any value is outside the bounds or missing.
     """
-    if df.index.duplicated().any():
-        n_dups = df.index.duplicated().sum()
-        if context:
-            logger.warning("Found %d duplicate dates for %s", n_dups, context)
-        else:
-            logger.warning("Found %d duplicate dates", n_dups)
+    # Plain float64 so nullable (Float64/Int64) and object columns compare
+    # without pd.NA; missing values become NaN and fail both comparisons
+    values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+    in_bounds = (values >= lower) & (values <= upper)
+    if in_bounds.all():
+        return
+
+    invalid = df[~in_bounds]
+    logger.warning(
+        "Found %d invalid %s values outside [%.1f, %.1f]",
+        len(invalid),
+        label,
+        lower,
+        upper,
+    )
+    raise ValueError(
+        f"{label[:1].upper()}{label[1:]} values outside valid range: {invalid.head()}"
+    )
 
 
 def validate_cdx_schema(df: pd.DataFrame, schema: CDXSchema = CDXSchema()) -> pd.DataFrame:
@@ -96,17 +162,7 @@ def validate_cdx_schema(df: pd.DataFrame, schema: CDXSchema = CDXSchema()) -> pd
         raise ValueError(f"Missing required columns: {missing_cols}")
 
     # Validate spread bounds
-    if not df[schema.spread_col].between(schema.min_spread, schema.max_spread).all():
-        invalid = df[
-            ~df[schema.spread_col].between(schema.min_spread, schema.max_spread)
-        ]
-        logger.warning(
-            "Found %d invalid spread values outside [%.1f, %.1f]",
-            len(invalid),
-            schema.min_spread,
-            schema.max_spread,
-        )
-        raise ValueError(f"Spread values outside valid range: {invalid.head()}")
+    _validate_bounds(df, schema.spread_col, schema.min_spread, schema.max_spread, "spread")
 
     # Convert to DatetimeIndex and sort
     df = _ensure_datetime_index(df, schema.date_col)
@@ -152,23 +208,15 @@ def validate_vix_schema(df: pd.DataFrame, schema: VIXSchema = VIXSchema()) -> pd
         raise ValueError(f"Missing required columns: {missing_cols}")
 
     # Validate VIX bounds
-    if not df[schema.close_col].between(schema.min_vix, schema.max_vix).all():
-        invalid = df[~df[schema.close_col].between(schema.min_vix, schema.max_vix)]
-        logger.warning(
-            "Found %d invalid VIX values outside [%.1f, %.1f]",
-            len(invalid),
-            schema.min_vix,
-            schema.max_vix,
-        )
-        raise ValueError(f"VIX values outside valid range: {invalid.head()}")
+    _validate_bounds(df, schema.close_col, schema.min_vix, schema.max_vix, "VIX")
 
     # Convert to DatetimeIndex and sort
     df = _ensure_datetime_index(df, schema.date_col)
 
     # Check for duplicates (remove duplicates for VIX)
-    if df.index.duplicated().any():
-        _check_duplicate_dates(df)
-        df = df[~df.index.duplicated(keep="first")]
+    duplicated = _check_duplicate_dates(df)
+    if duplicated.any():
+        df = df[~duplicated]
 
     logger.debug("VIX validation passed: date_range=%s to %s", df.index.min(), df.index.max())
     return df
@@ -208,24 +256,20 @@ def validate_etf_schema(df: pd.DataFrame, schema: ETFSchema = ETFSchema()) -> pd
         raise ValueError(f"Missing required columns: {missing_cols}")
 
     # Validate price bounds
-    if not df[schema.close_col].between(schema.min_price, schema.max_price).all():
-        invalid = df[~df[schema.close_col].between(schema.min_price, schema.max_price)]
-        logger.warning(
-            "Found %d invalid price values outside [%.1f, %.1f]",
-            len(invalid),
-            schema.min_price,
-            schema.max_price,
-        )
-        raise ValueError(f"Price values outside valid range: {invalid.head()}")
+    _validate_bounds(df, schema.close_col, schema.min_price, schema.max_price, "price")
 
     # Convert to DatetimeIndex and sort
     df = _ensure_datetime_index(df, schema.date_col)
 
     # Check for duplicates per ticker
     if schema.ticker_col in df.columns:
-        for ticker in df[schema.ticker_col].unique():
-            ticker_df = df[df[schema.ticker_col] == ticker]
-            _check_duplicate_dates(ticker_df, context=f"ticker {ticker}")
+        # One hash pass over (ticker, date) pairs instead of a scan per ticker
+        keys = pd.DataFrame({"ticker": df[schema.ticker_col].to_numpy(), "date": df.index})
+        duplicated = keys.duplicated().to_numpy()
+        if duplicated.any():
+            dup_counts = keys.loc[duplicated, "ticker"].value_counts(sort=False)
+            for ticker, n_dups in dup_counts.items():
+                logger.warning("Found %d duplicate dates for ticker %s", n_dups, ticker)
 
     logger.debug("ETF validation passed: date_range=%s to %s", df.index.min(), df.index.max())
     return df
@@ -4,9 +4,15 @@ Signal registry for managing signal metadata and catalog persistence.
 
 import json
 import logging
-from dataclasses import dataclass, asdict
+from collections.abc import Callable
+from dataclasses import dataclass, asdict, replace
+from functools import lru_cache
 from pathlib import Path
 
+import pandas as pd
+
+from . import signals
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,7 +55,7 @@ class SignalMetadata:
         if not self.arg_mapping:
             raise ValueError("arg_mapping cannot be empty")
         # Validate arg_mapping is subset of data_requirements keys
-        missing_args = set(self.arg_mapping) - set(self.data_requirements.keys())
+        missing_args = {key for key in self.arg_mapping if key not in self.data_requirements}
         if missing_args:
             raise ValueError(
                 f"arg_mapping contains keys not in data_requirements: {missing_args}"
@@ -93,6 +99,8 @@ class SignalRegistry:
         """
         self._catalog_path = Path(catalog_path)
         self._signals: dict[str, SignalMetadata] = {}
+        self._compute_fns: dict[str, Callable[..., pd.Series]] = {}
+        self._enabled: dict[str, SignalMetadata] | None = None
         self._load_catalog()
 
         logger.info(
@@ -109,24 +117,22 @@ class SignalRegistry:
                 f"Signal catalog not found: {self._catalog_path}"
             )
 
-        with open(self._catalog_path, "r", encoding="utf-8") as f:
-            catalog_data = json.load(f)
-
-        if not isinstance(catalog_data, list):
-            raise ValueError("Signal catalog must be a JSON array")
-
-        for entry in catalog_data:
-            try:
-                metadata = SignalMetadata(**entry)
-                if metadata.name in self._signals:
-                    raise ValueError(
-                        f"Duplicate signal name in catalog: {metadata.name}"
-                    )
-                self._signals[metadata.name] = metadata
-            except TypeError as e:
-                raise ValueError(
-                    f"Invalid signal metadata in catalog: {entry}. Error: {e}"
-                ) from e
+        # Parse is memoized per file version; edits to the catalog invalidate it
+        stat = self._catalog_path.stat()
+        catalog = _parse_catalog(
+            str(self._catalog_path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+        # Memoized entries are shared across registries; give this registry
+        # its own copies of the mutable fields
+        self._signals = {
+            metadata.name: replace(
+                metadata,
+                data_requirements=dict(metadata.data_requirements),
+                arg_mapping=list(metadata.arg_mapping),
+            )
+            for metadata in catalog
+        }
+        self._enabled = None
 
         logger.debug("Loaded %d signals from catalog", len(self._signals))
 
@@ -156,6 +162,37 @@ class SignalRegistry:
             )
         return self._signals[name]
 
+    def get_compute_fn(self, name: str) -> Callable[..., pd.Series]:
+        """
+        Resolve the compute function for a registered signal.
+
+        Resolution is deferred to first use and cached on the registry, so
+        catalogs may reference functions that are never called.
+
+        Parameters
+        ----------
+        name : str
+            Signal name.
+
+        Returns
+        -------
+        Callable[..., pd.Series]
+            Signal compute function from the signals module.
+
+        Raises
+        ------
+        KeyError
+            If signal name is not registered.
+        AttributeError
+            If the signals module has no function with the catalog's name.
+        """
+        compute_fn = self._compute_fns.get(name)
+        if compute_fn is None:
+            metadata = self.get_metadata(name)
+            compute_fn = getattr(signals, metadata.compute_function_name)
+            self._compute_fns[name] = compute_fn
+        return compute_fn
+
     def get_enabled(self) -> dict[str, SignalMetadata]:
         """
         Get all enabled signals.
@@ -164,10 +201,17 @@ class SignalRegistry:
         -------
         dict[str, SignalMetadata]
             Mapping from signal name to metadata for enabled signals only.
+
+        Notes
+        -----
+        The filtered view is built once per catalog load; each call
+        returns a shallow copy so callers may modify it freely.
         """
-        return {
-            name: meta for name, meta in self._signals.items() if meta.enabled
-        }
+        if self._enabled is None:
+            self._enabled = {
+                name: meta for name, meta in self._signals.items() if meta.enabled
+            }
+        return self._enabled.copy()
 
     def list_all(self) -> dict[str, SignalMetadata]:
         """
@@ -198,3 +242,53 @@ class SignalRegistry:
             json.dump(catalog_data, f, indent=2)
 
         logger.info("Saved signal catalog: path=%s, signals=%d", output_path, len(catalog_data))
+
+
+@lru_cache(maxsize=8)
+def _parse_catalog(path: str, mtime_ns: int, size: int) -> tuple[SignalMetadata, ...]:
+    """
+    Parse and validate a signal catalog file.
+
+    Parameters
+    ----------
+    path : str
+        Resolved path to JSON catalog file.
+    mtime_ns : int
+        File modification time, part of the cache key so that edits
+        to the catalog are picked up by later registry instances.
+    size : int
+        File size in bytes. Also part of the cache key, to catch rewrites
+        within the filesystem's timestamp resolution.
+
+    Returns
+    -------
+    tuple[SignalMetadata, ...]
+        Signal metadata in catalog order. Shared by every caller with the
+        same key, so callers must copy the mutable fields before use.
+
+    Raises
+    ------
+    ValueError
+        If catalog JSON is invalid or contains duplicate signal names.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        catalog_data = json.load(f)
+
+    if not isinstance(catalog_data, list):
+        raise ValueError("Signal catalog must be a JSON array")
+
+    parsed: dict[str, SignalMetadata] = {}
+    for entry in catalog_data:
+        try:
+            metadata = SignalMetadata(**entry)
+            if metadata.name in parsed:
+                raise ValueError(
+                    f"Duplicate signal name in catalog: {metadata.name}"
+                )
+            parsed[metadata.name] = metadata
+        except TypeError as e:
+            raise ValueError(
+                f"Invalid signal metadata in catalog: {entry}. Error: {e}"
+            ) from e
+
+    return tuple(parsed.values())
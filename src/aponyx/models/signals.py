@@ -8,8 +8,11 @@ Implements the three pilot signals:
 """
 
 import logging
+
+import numpy as np
 import pandas as pd
 
+from .._njit import njit
 from .config import SignalConfig
 
 logger = logging.getLogger(__name__)
@@ -39,7 +42,7 @@ def compute_cdx_etf_basis(
     Returns
     -------
     pd.Series
-        Z-score normalized basis signal aligned to common dates.
+        Z-score normalized basis signal aligned to common dates (float64).
 
     Notes
     -----
@@ -62,21 +65,17 @@ def compute_cdx_etf_basis(
     etf_spread = etf_df["close"].reindex(cdx_df.index, method="ffill")
 
     # Compute raw basis
-    raw_basis = cdx_spread - etf_spread
+    raw_basis = cdx_spread.to_numpy(dtype=np.float64) - etf_spread.to_numpy(dtype=np.float64)
 
-    # Normalize using rolling z-score
-    rolling_mean = raw_basis.rolling(
-        window=config.lookback,
-        min_periods=config.min_periods,
-    ).mean()
-    rolling_std = raw_basis.rolling(
-        window=config.lookback,
-        min_periods=config.min_periods,
-    ).std()
+    # Normalize using rolling z-score (mean and std from one windowed pass)
+    rolling_mean, rolling_std = _rolling_mean_std(
+        raw_basis, config.lookback, config.min_periods
+    )
 
-    signal = (raw_basis - rolling_mean) / rolling_std
+    with np.errstate(divide="ignore", invalid="ignore"):
+        signal = pd.Series((raw_basis - rolling_mean) / rolling_std, index=cdx_df.index)
 
-    valid_count = signal.notna().sum()
+    valid_count = np.count_nonzero(~np.isnan(signal.to_numpy()))
     logger.debug("Generated %d valid basis signals", valid_count)
 
     return signal
@@ -106,7 +105,7 @@ def compute_cdx_vix_gap(
     Returns
     -------
     pd.Series
-        Z-score normalized CDX-VIX gap signal.
+        Z-score normalized CDX-VIX gap signal (float64).
 
     Notes
     -----
@@ -129,21 +128,12 @@ def compute_cdx_vix_gap(
     cdx = cdx_df["spread"]
     vix = vix_df["close"].reindex(cdx_df.index, method="ffill")
 
-    # Compute deviations from rolling means
-    cdx_deviation = (
-        cdx
-        - cdx.rolling(
-            window=config.lookback,
-            min_periods=config.min_periods,
-        ).mean()
-    )
-    vix_deviation = (
-        vix
-        - vix.rolling(
-            window=config.lookback,
-            min_periods=config.min_periods,
-        ).mean()
+    # Compute deviations from rolling means (both series in one windowed pass)
+    levels = np.column_stack(
+        [cdx.to_numpy(dtype=np.float64), vix.to_numpy(dtype=np.float64)]
     )
+    rolling_means, _ = _rolling_mean_std(levels, config.lookback, config.min_periods)
+    cdx_deviation, vix_deviation = (levels - rolling_means).T
 
     # Raw gap: CDX stress minus VIX stress
     # Positive when credit stress outpaces equity stress (buy CDX)
@@ -151,13 +141,11 @@ def compute_cdx_vix_gap(
     raw_gap = cdx_deviation - vix_deviation
 
     # Normalize the gap
-    rolling_std = raw_gap.rolling(
-        window=config.lookback,
-        min_periods=config.min_periods,
-    ).std()
-    signal = raw_gap / rolling_std
+    _, rolling_std = _rolling_mean_std(raw_gap, config.lookback, config.min_periods)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        signal = pd.Series(raw_gap / rolling_std, index=cdx_df.index)
 
-    valid_count = signal.notna().sum()
+    valid_count = np.count_nonzero(~np.isnan(signal.to_numpy()))
     logger.debug("Generated %d valid CDX-VIX gap signals", valid_count)
 
     return signal
@@ -184,7 +172,7 @@ def compute_spread_momentum(
     Returns
     -------
     pd.Series
-        Z-score normalized momentum signal.
+        Z-score normalized momentum signal (float64).
 
     Notes
     -----
@@ -201,21 +189,111 @@ def compute_spread_momentum(
         config.lookback,
     )
 
-    spread = cdx_df["spread"]
+    spread = cdx_df["spread"].to_numpy(dtype=np.float64)
 
     # Compute spread change over lookback period (negative for tightening)
-    spread_change = spread - spread.shift(config.lookback)
+    spread_change = np.full_like(spread, np.nan)
+    spread_change[config.lookback :] = spread[config.lookback :] - spread[: -config.lookback]
 
     # Normalize by rolling volatility and negate
     # Positive when spreads tightening (buy CDX)
     # Negative when spreads widening (sell CDX)
-    rolling_std = spread.rolling(
-        window=config.lookback,
-        min_periods=config.min_periods,
-    ).std()
-    signal = -spread_change / rolling_std
+    _, rolling_std = _rolling_mean_std(spread, config.lookback, config.min_periods)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        signal = pd.Series(-spread_change / rolling_std, index=cdx_df.index)
 
-    valid_count = signal.notna().sum()
+    valid_count = np.count_nonzero(~np.isnan(signal.to_numpy()))
     logger.debug("Generated %d valid momentum signals", valid_count)
 
     return signal
+
+
+def _rolling_mean_std(
+    values: np.ndarray,
+    lookback: int,
+    min_periods: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Trailing rolling mean and sample standard deviation in a single pass.
+
+    Matches ``pd.Series.rolling(lookback, min_periods).mean()/.std()``:
+    NaNs are skipped, and a window yields NaN unless it holds at least
+    ``min_periods`` valid observations (two for the standard deviation).
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Input of shape (n,) or (n, k); columns are windowed independently.
+    lookback : int
+        Window length.
+    min_periods : int
+        Minimum valid observations per window.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Rolling mean and standard deviation (ddof=1), same shape as input.
+    """
+    columns = np.ascontiguousarray(values.reshape(len(values), -1), dtype=np.float64)
+    mean = np.empty_like(columns)
+    std = np.empty_like(columns)
+    _rolling_mean_std_loop(columns, lookback, min_periods, mean, std)
+    return mean.reshape(values.shape), std.reshape(values.shape)
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean_std_loop(
+    values: np.ndarray,
+    lookback: int,
+    min_periods: int,
+    mean_out: np.ndarray,
+    std_out: np.ndarray,
+) -> None:
+    """
+    Fill rolling mean/std outputs with O(1) Welford add/remove updates.
+
+    Each column keeps a running count, mean and sum of squared deviations;
+    the entering observation is added and the one leaving the window is
+    removed, so total cost is O(n) regardless of ``lookback``.
+    """
+    n, k = values.shape
+    for j in range(k):
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        # Run of identical trailing values; when it spans the whole window the
+        # statistics are exact (std 0), as in pandas
+        last_value = np.nan
+        same_run = 0
+        for i in range(n):
+            x = values[i, j]
+            if not np.isnan(x):
+                count += 1
+                delta = x - mean
+                mean += delta / count
+                m2 += delta * (x - mean)
+                same_run = same_run + 1 if x == last_value else 1
+                last_value = x
+
+            if i >= lookback:
+                old = values[i - lookback, j]
+                if not np.isnan(old):
+                    count -= 1
+                    if count == 0:
+                        mean = 0.0
+                        m2 = 0.0
+                    else:
+                        delta = old - mean
+                        mean -= delta / count
+                        m2 = max(m2 - delta * (old - mean), 0.0)
+
+            if count >= min_periods:
+                if same_run >= count:
+                    mean_out[i, j] = last_value
+                    std_out[i, j] = 0.0 if count >= 2 else np.nan
+                else:
+                    mean_out[i, j] = mean
+                    std_out[i, j] = np.sqrt(m2 / (count - 1)) if count >= 2 else np.nan
+            else:
+                mean_out[i, j] = np.nan
+                std_out[i, j] = np.nan
@@ -5,14 +5,22 @@ Provides clean abstractions for Parquet and JSON I/O, with a registry
 system to track available datasets.
 """
 
-from .parquet_io import save_parquet, load_parquet, list_parquet_files
+from .parquet_io import (
+    save_parquet,
+    save_parquet_row_groups,
+    load_parquet,
+    list_parquet_files,
+    clear_parquet_cache,
+)
 from .json_io import save_json, load_json
 from .registry import DataRegistry, DatasetEntry
 
 __all__ = [
     "save_parquet",
+    "save_parquet_row_groups",
     "load_parquet",
     "list_parquet_files",
+    "clear_parquet_cache",
     "save_json",
     "load_json",
     "DataRegistry",
@@ -7,11 +7,17 @@ including datetime, Path, and numpy arrays.
 
 import json
 import logging
+import math
 from pathlib import Path
 from typing import Any
 from datetime import datetime, date
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +26,8 @@ class EnhancedJSONEncoder(json.JSONEncoder):
     JSON encoder with support for datetime, Path, and numpy types.
 
     Extends standard JSONEncoder to handle common scientific computing types
-    that appear in metadata and parameter dictionaries.
+    that appear in metadata and parameter dictionaries. Non-finite numpy
+    floats are encoded as ``null``, matching orjson.
     """
 
     def default(self, obj: Any) -> Any:
@@ -32,12 +39,35 @@ class EnhancedJSONEncoder(json.JSONEncoder):
         elif isinstance(obj, np.integer):
             return int(obj)
         elif isinstance(obj, np.floating):
-            return float(obj)
+            return float(obj) if np.isfinite(obj) else None
         elif isinstance(obj, np.ndarray):
-            return obj.tolist()
+            return _replace_non_finite(obj.tolist())
         return super().default(obj)
 
 
+def _replace_non_finite(obj: Any) -> Any:
+    """Return a copy of nested dicts/lists with NaN and Inf floats as None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    return obj
+
+
+_FALLBACK_ENCODER = EnhancedJSONEncoder()
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Convert types orjson does not handle natively (e.g., Path)."""
+    # datetime/date and numpy values are serialized by orjson itself, so
+    # only Path (and rare numpy dtypes) ever reach this hook
+    if isinstance(obj, Path):
+        return str(obj)
+    return _FALLBACK_ENCODER.default(obj)
+
+
 def save_json(
     data: dict[str, Any],
     path: str | Path,
@@ -63,6 +93,13 @@ def save_json(
     Path
         Absolute path to the saved file.
 
+    Notes
+    -----
+    Uses ``orjson`` when installed (``pip install aponyx[perf]``) and the
+    indent is 0 or 2, which orjson supports natively. Otherwise falls back
+    to the standard library encoder. Both write strict JSON with NaN/Inf
+    floats as ``null``, so files are identical in meaning either way.
+
     Examples
     --------
     >>> metadata = {
@@ -77,15 +114,26 @@ def save_json(
 
     logger.info("Saving JSON to %s (%d top-level keys)", path, len(data))
 
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(
-            data,
-            f,
-            cls=EnhancedJSONEncoder,
-            indent=indent,
-            sort_keys=sort_keys,
-            ensure_ascii=False,
-        )
+    if orjson is not None and indent in (0, 2):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        path.write_bytes(orjson.dumps(data, default=_orjson_default, option=option))
+    else:
+        # json.dump streams iterencode chunks to the file; a 1 MiB buffer
+        # batches those many small writes into few syscalls
+        with path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(
+                _replace_non_finite(data),
+                f,
+                cls=EnhancedJSONEncoder,
+                indent=indent,
+                sort_keys=sort_keys,
+                ensure_ascii=False,
+                allow_nan=False,
+            )
 
     logger.debug("Successfully saved %d bytes to %s", path.stat().st_size, path)
     return path.absolute()
@@ -112,6 +160,12 @@ def load_json(path: str | Path) -> dict[str, Any]:
     json.JSONDecodeError
         If the file contains invalid JSON.
 
+    Notes
+    -----
+    Files written by earlier versions may contain non-standard ``NaN`` or
+    ``Infinity`` tokens. orjson rejects these, so such files are parsed by
+    the standard library instead.
+
     Examples
     --------
     >>> metadata = load_json('logs/run_20241025.json')
@@ -123,8 +177,15 @@ def load_json(path: str | Path) -> dict[str, Any]:
 
     logger.info("Loading JSON from %s", path)
 
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        content = path.read_bytes()
+        try:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            data = json.loads(content)
+    else:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
 
     logger.debug("Loaded JSON with %d top-level keys", len(data) if isinstance(data, dict) else 0)
     return data
@@ -5,17 +5,79 @@ Handles efficient storage and retrieval of market data (CDX spreads, VIX, ETF pr
 with metadata preservation and validation.
 """
 
+import fnmatch
 import logging
+import os
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 logger = logging.getLogger(__name__)
 
+# Smallest row group written; larger frames are split into about eight
+# groups so date filters on load_parquet can skip most of a long history
+_MIN_ROW_GROUP_SIZE = 4096
+
+# Upper bound on Arrow table memory held for load_parquet(cache=True)
+_TABLE_CACHE_MAX_BYTES = 256 * 1024**2
+
+
+class _TableCache:
+    """
+    Least-recently-used Arrow table cache bounded by total table bytes.
+
+    Keys identify a file version (resolved path, mtime_ns, size) and the
+    column selection, so rewriting a file invalidates its entries.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._tables: OrderedDict[tuple[Any, ...], pa.Table] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> pa.Table | None:
+        """Return the cached table for ``key`` and mark it recently used."""
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+            return table
+
+    def put(self, key: tuple[Any, ...], table: pa.Table) -> None:
+        """Store ``table``, evicting least recently used tables over budget."""
+        if table.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._tables:
+                return
+            self._tables[key] = table
+            self._nbytes += table.nbytes
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._tables.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Drop all cached tables."""
+        with self._lock:
+            self._tables.clear()
+            self._nbytes = 0
+
+
+_table_cache = _TableCache(_TABLE_CACHE_MAX_BYTES)
+
 
 def save_parquet(
     df: pd.DataFrame,
     path: str | Path,
-    compression: str = "snappy",
+    compression: str = "lz4",
     index: bool = True,
 ) -> Path:
     """
@@ -27,8 +89,8 @@ def save_parquet(
         DataFrame to persist. For time series, index should be DatetimeIndex.
     path : str or Path
         Target file path. Parent directories created if needed.
-    compression : str, default "snappy"
-        Compression algorithm. Options: "snappy", "gzip", "brotli", "zstd".
+    compression : str, default "lz4"
+        Compression algorithm. Options: "lz4", "snappy", "gzip", "brotli", "zstd".
     index : bool, default True
         Whether to write DataFrame index to file.
 
@@ -65,19 +127,127 @@ def save_parquet(
     df.to_parquet(
         path,
         engine="pyarrow",
-        compression=compression,
         index=index,
+        row_group_size=max(_MIN_ROW_GROUP_SIZE, len(df) // 8),
+        **_write_options(df, compression),
+    )
+
+    logger.debug("Successfully saved %d bytes to %s", path.stat().st_size, path)
+    return path.absolute()
+
+
+def save_parquet_row_groups(
+    frames: list[pd.DataFrame],
+    path: str | Path,
+    compression: str = "lz4",
+) -> Path:
+    """
+    Save same-schema DataFrames to one Parquet file without concatenating.
+
+    Parameters
+    ----------
+    frames : list[pd.DataFrame]
+        Frames with identical columns and dtypes. Indexes are dropped, so
+        the file reads back like ``pd.concat(frames, ignore_index=True)``.
+    path : str or Path
+        Target file path. Parent directories created if needed.
+    compression : str, default "lz4"
+        Compression algorithm, as for ``save_parquet``.
+
+    Returns
+    -------
+    Path
+        Absolute path to the saved file.
+
+    Raises
+    ------
+    ValueError
+        If no frames are given.
+
+    Notes
+    -----
+    Each frame becomes its own row group, so peak memory is one frame
+    rather than the combined output. Writer options match save_parquet.
+
+    Examples
+    --------
+    >>> save_parquet_row_groups([hyg_df, lqd_df], 'data/etf_prices.parquet')
+    """
+    if not frames:
+        raise ValueError("Cannot save an empty list of DataFrames")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    logger.info(
+        "Saving %d DataFrames to Parquet row groups: path=%s, compression=%s",
+        len(frames),
+        path,
+        compression,
     )
 
+    tables = (pa.Table.from_pandas(frame, preserve_index=False) for frame in frames)
+    first = next(tables)
+
+    with pq.ParquetWriter(
+        path, first.schema, **_write_options(frames[0], compression)
+    ) as writer:
+        writer.write_table(first)
+        for table in tables:
+            writer.write_table(table)
+
     logger.debug("Successfully saved %d bytes to %s", path.stat().st_size, path)
     return path.absolute()
 
 
+def _write_options(df: pd.DataFrame, compression: str) -> dict[str, Any]:
+    """
+    Build pyarrow Parquet writer options for a DataFrame's columns.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame about to be written.
+    compression : str
+        Compression codec.
+
+    Returns
+    -------
+    dict[str, Any]
+        Keyword arguments for ``pq.write_table``/``pq.ParquetWriter``.
+
+    Notes
+    -----
+    - Float columns use BYTE_STREAM_SPLIT, which groups the bytes of each
+      value so smooth price/spread series compress far better than PLAIN.
+    - Only label columns (strings, categoricals) are dictionary encoded;
+      dictionaries rarely pay off for unique floats or timestamps.
+    - Data page V2 stores levels uncompressed alongside the values, so
+      readers can decode float/timestamp pages with less work.
+    """
+    float_cols = [str(name) for name, dtype in df.dtypes.items() if dtype.kind == "f"]
+    label_cols = [
+        str(name)
+        for name, dtype in df.dtypes.items()
+        if dtype.kind == "O" or isinstance(dtype, (pd.CategoricalDtype, pd.StringDtype))
+    ]
+    return {
+        "compression": compression,
+        "use_dictionary": label_cols or False,
+        "use_byte_stream_split": float_cols or False,
+        "data_page_version": "2.0",
+        "write_statistics": True,
+    }
+
+
 def load_parquet(
     path: str | Path,
     columns: list[str] | None = None,
     start_date: pd.Timestamp | None = None,
     end_date: pd.Timestamp | None = None,
+    downcast: bool = False,
+    categoricals: list[str] | None = None,
+    cache: bool = False,
 ) -> pd.DataFrame:
     """
     Load DataFrame from Parquet with optional filtering.
@@ -92,6 +262,18 @@ def load_parquet(
         Filter data from this date (inclusive). Requires DatetimeIndex.
     end_date : pd.Timestamp, optional
         Filter data to this date (inclusive). Requires DatetimeIndex.
+    downcast : bool, default False
+        Shrink float64 columns to float32 and int64 columns to the
+        smallest integer type that holds their values. Float downcasting
+        keeps about 7 significant digits.
+    categoricals : list of str, optional
+        Columns to convert to categorical dtype (e.g., instrument or
+        ticker labels).
+    cache : bool, default False
+        Keep the Arrow table for unfiltered reads in an in-process cache
+        and serve later unfiltered reads of the same file version from it.
+        The cache holds at most 256 MiB of tables, evicting the least
+        recently used; see ``clear_parquet_cache``.
 
     Returns
     -------
@@ -110,6 +292,8 @@ def load_parquet(
     >>> df = load_parquet('data/cdx_ig_5y.parquet', 
     ...                   start_date=pd.Timestamp('2024-01-01'))
     >>> df = load_parquet('data/vix.parquet', columns=['close'])
+    >>> df = load_parquet('data/etf_prices.parquet', downcast=True,
+    ...                   categoricals=['ticker'])
     """
     path = Path(path)
     if not path.exists():
@@ -117,20 +301,46 @@ def load_parquet(
 
     logger.info("Loading Parquet file: path=%s, columns=%s", path, columns or "all")
 
-    df = pd.read_parquet(path, engine="pyarrow", columns=columns)
+    date_filtered = start_date is not None or end_date is not None
+    filters = _index_date_filters(path, start_date, end_date) if date_filtered else None
 
-    # Apply date filtering if requested
-    if start_date is not None or end_date is not None:
+    if filters is not None:
+        # Row groups outside the date range are skipped using column statistics;
+        # memory-mapping reads column buffers straight from the page cache
+        df = pd.read_parquet(
+            path, engine="pyarrow", columns=columns, filters=filters, memory_map=True
+        )
+        logger.debug(
+            "Pushed down date filter: start=%s, end=%s, resulting_rows=%d",
+            start_date,
+            end_date,
+            len(df),
+        )
+    elif cache:
+        # Each call converts the shared table into its own DataFrame
+        df = _read_table_cached(path, columns).to_pandas()
+    else:
+        df = pd.read_parquet(path, engine="pyarrow", columns=columns, memory_map=True)
+
+    # Apply date filtering in memory when it could not be pushed down
+    if date_filtered and filters is None:
         if not isinstance(df.index, pd.DatetimeIndex):
             raise ValueError(
                 "Date filtering requires DatetimeIndex. "
                 f"Got {type(df.index).__name__}"
             )
 
-        if start_date is not None:
-            df = df[df.index >= start_date]
-        if end_date is not None:
-            df = df[df.index <= end_date]
+        if df.index.is_monotonic_increasing:
+            # Sorted index (the usual case): binary search for the bounds
+            # and take a positional slice instead of building masks
+            lo = 0 if start_date is None else df.index.searchsorted(start_date, side="left")
+            hi = len(df) if end_date is None else df.index.searchsorted(end_date, side="right")
+            df = df.iloc[lo:hi]
+        else:
+            if start_date is not None:
+                df = df[df.index >= start_date]
+            if end_date is not None:
+                df = df[df.index <= end_date]
 
         logger.debug(
             "Applied date filter: start=%s, end=%s, resulting_rows=%d",
@@ -139,10 +349,142 @@ def load_parquet(
             len(df),
         )
 
+    if downcast or categoricals:
+        df = _shrink_dtypes(df, downcast, categoricals)
+
     logger.info("Loaded %d rows, %d columns from %s", len(df), len(df.columns), path)
     return df
 
 
+def clear_parquet_cache() -> None:
+    """
+    Release all Arrow tables cached by ``load_parquet(cache=True)``.
+
+    Examples
+    --------
+    >>> df = load_parquet('data/vix.parquet', cache=True)
+    >>> clear_parquet_cache()
+    """
+    _table_cache.clear()
+    logger.debug("Cleared Parquet table cache")
+
+
+def _read_table_cached(path: Path, columns: list[str] | None) -> pa.Table:
+    """
+    Read a Parquet file into an Arrow table, memoized per file version.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the Parquet file.
+    columns : list of str or None
+        Columns to read, or None for all.
+
+    Returns
+    -------
+    pa.Table
+        Immutable table shared by every caller with the same key.
+
+    Notes
+    -----
+    The file is read into memory rather than memory-mapped. A cached
+    mapping would keep the file open, and on Windows that blocks
+    ``save_parquet`` from overwriting it.
+    """
+    stat = path.stat()
+    key = (
+        str(path.resolve()),
+        stat.st_mtime_ns,
+        stat.st_size,
+        None if columns is None else tuple(columns),
+    )
+    table = _table_cache.get(key)
+    if table is None:
+        table = pq.read_table(path, columns=columns, use_pandas_metadata=True)
+        _table_cache.put(key, table)
+    return table
+
+
+def _shrink_dtypes(
+    df: pd.DataFrame,
+    downcast: bool,
+    categoricals: list[str] | None,
+) -> pd.DataFrame:
+    """
+    Convert columns to narrower dtypes in a single ``astype`` pass.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Loaded data.
+    downcast : bool
+        Narrow float64 to float32 and int64 to the smallest fitting int.
+    categoricals : list of str or None
+        Columns to convert to categorical.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with converted columns.
+    """
+    dtypes: dict[Any, Any] = {}
+    if downcast:
+        for name, dtype in df.dtypes.items():
+            if dtype == np.float64:
+                dtypes[name] = np.float32
+            elif dtype == np.int64:
+                dtypes[name] = pd.to_numeric(df[name], downcast="integer").dtype
+    for name in categoricals or []:
+        dtypes[name] = "category"
+
+    logger.debug("Converting column dtypes: %s", dtypes)
+    return df.astype(dtypes)
+
+
+def _index_date_filters(
+    path: Path,
+    start_date: pd.Timestamp | None,
+    end_date: pd.Timestamp | None,
+) -> list[tuple[str, str, Any]] | None:
+    """
+    Build PyArrow filters on the stored DatetimeIndex column.
+
+    Parameters
+    ----------
+    path : Path
+        Parquet file written from a pandas DataFrame.
+    start_date : pd.Timestamp or None
+        Inclusive lower bound.
+    end_date : pd.Timestamp or None
+        Inclusive upper bound.
+
+    Returns
+    -------
+    list of tuple or None
+        Filters for ``pd.read_parquet``, or None if the file has no single
+        timezone-naive timestamp index column to filter on. Callers then
+        fall back to filtering in memory.
+    """
+    schema = pq.read_schema(path)
+    index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+    if len(index_columns) != 1 or not isinstance(index_columns[0], str):
+        return None
+
+    index_name = index_columns[0]
+    field_type = schema.field(index_name).type
+    if not pa.types.is_timestamp(field_type) or field_type.tz is not None:
+        return None
+
+    filters = []
+    for op, bound in ((">=", start_date), ("<=", end_date)):
+        if bound is not None:
+            bound = pd.Timestamp(bound)
+            if bound.tzinfo is not None:
+                return None
+            filters.append((index_name, op, bound))
+    return filters
+
+
 def list_parquet_files(directory: str | Path, pattern: str = "*.parquet") -> list[Path]:
     """
     List all Parquet files in a directory matching a pattern.
@@ -159,6 +501,12 @@ def list_parquet_files(directory: str | Path, pattern: str = "*.parquet") -> lis
     list of Path
         Sorted list of matching file paths.
 
+    Notes
+    -----
+    Single-level patterns are matched against ``os.scandir`` entry names
+    with one compiled regex, without creating a Path per entry. Patterns
+    containing a path separator or ``**`` use ``Path.glob``.
+
     Examples
     --------
     >>> files = list_parquet_files('data/', pattern='cdx_*.parquet')
@@ -169,6 +517,13 @@ def list_parquet_files(directory: str | Path, pattern: str = "*.parquet") -> lis
         logger.debug("Directory does not exist: %s", directory)
         return []
 
-    files = sorted(directory.glob(pattern))
+    if "/" in pattern or os.sep in pattern or "**" in pattern:
+        files = sorted(directory.glob(pattern))
+    else:
+        matches = re.compile(fnmatch.translate(pattern)).match
+        with os.scandir(directory) as entries:
+            names = [entry.name for entry in entries if matches(entry.name)]
+        files = [directory / name for name in sorted(names)]
+
     logger.info("Found %d Parquet files in %s (pattern=%s)", len(files), directory, pattern)
     return files
@@ -6,6 +6,9 @@ validation status, and update timestamps.
 """
 
 import logging
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
@@ -106,6 +109,8 @@ class DataRegistry:
         self.registry_path = Path(registry_path)
         self.data_directory = Path(data_directory)
         self.data_directory.mkdir(parents=True, exist_ok=True)
+        self._batch_depth = 0
+        self._pending_save = False
 
         # Load existing registry or create new
         if self.registry_path.exists():
@@ -255,10 +260,41 @@ class DataRegistry:
             raise KeyError(f"Dataset '{name}' not found in registry")
         return DatasetEntry.from_dict(self._catalog[name])
 
+    def get_many(self, names: list[str]) -> list[DatasetEntry]:
+        """
+        Retrieve several datasets as typed DatasetEntry objects.
+
+        Parameters
+        ----------
+        names : list of str
+            Dataset identifiers.
+
+        Returns
+        -------
+        list of DatasetEntry
+            Entries in the same order as ``names``.
+
+        Raises
+        ------
+        KeyError
+            If any dataset name is not found in registry.
+
+        Examples
+        --------
+        >>> entries = registry.get_many(['cdx_ig_5y', 'vix'])
+        >>> [e.instrument for e in entries]
+        ['CDX.NA.IG', 'VIX']
+        """
+        missing = [name for name in names if name not in self._catalog]
+        if missing:
+            raise KeyError(f"Datasets not found in registry: {missing}")
+        return [DatasetEntry.from_dict(self._catalog[name]) for name in names]
+
     def list_datasets(
         self,
         instrument: str | None = None,
         tenor: str | None = None,
+        instrument_prefix: str | None = None,
     ) -> list[str]:
         """
         List registered datasets, optionally filtered by instrument/tenor.
@@ -269,6 +305,8 @@ class DataRegistry:
             Filter by instrument (e.g., 'CDX.NA.IG', 'VIX').
         tenor : str, optional
             Filter by tenor (e.g., '5Y', '10Y').
+        instrument_prefix : str, optional
+            Filter by instrument prefix (e.g., 'CDX' for all CDX indices).
 
         Returns
         -------
@@ -281,11 +319,17 @@ class DataRegistry:
         ['cdx_ig_5y', 'cdx_ig_10y']
         >>> registry.list_datasets(tenor='5Y')
         ['cdx_ig_5y', 'cdx_hy_5y', 'cdx_xo_5y']
+        >>> registry.list_datasets(instrument_prefix='CDX')
+        ['cdx_hy_5y', 'cdx_ig_5y']
         """
         datasets = []
         for name, info in self._catalog.items():
             if instrument and info.get("instrument") != instrument:
                 continue
+            if instrument_prefix and not info.get("instrument", "").startswith(
+                instrument_prefix
+            ):
+                continue
             if tenor and info.get("tenor") != tenor:
                 continue
             datasets.append(name)
@@ -363,9 +407,46 @@ class DataRegistry:
         self._save()
         logger.info("Removed dataset from registry: name=%s", name)
 
+    @contextmanager
+    def batch(self) -> Iterator["DataRegistry"]:
+        """
+        Defer registry file writes until the block exits.
+
+        Each mutating call normally rewrites the whole registry JSON. Inside
+        a batch, changes are kept in memory and written once on exit
+        (including on error, so completed changes are not lost). Batches
+        may be nested; only the outermost one writes.
+
+        Yields
+        ------
+        DataRegistry
+            This registry.
+
+        Examples
+        --------
+        >>> with registry.batch():
+        ...     registry.register_dataset('cdx_ig_5y', 'data/cdx_ig_5y.parquet', 'CDX.NA.IG')
+        ...     registry.register_dataset('vix', 'data/vix.parquet', 'VIX')
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending_save:
+                self._save()
+
     def _save(self) -> None:
-        """Persist registry catalog to JSON file."""
-        save_json(self._catalog, self.registry_path)
+        """Persist registry catalog to JSON file (deferred inside a batch)."""
+        if self._batch_depth:
+            self._pending_save = True
+            return
+
+        # Write to a sibling file and swap it in, so readers never see a partial file
+        tmp_path = self.registry_path.with_name(self.registry_path.name + ".tmp")
+        save_json(self._catalog, tmp_path)
+        os.replace(tmp_path, self.registry_path)
+        self._pending_save = False
 
     def __repr__(self) -> str:
         """String representation showing registry statistics."""
@@ -10,7 +10,9 @@ from aponyx.backtest import (
     BacktestConfig,
     run_backtest,
     compute_performance_metrics,
+    position_change_mask,
 )
+from aponyx.backtest.engine import _backtest_loop, _backtest_vectorized
 
 
 @pytest.fixture
@@ -272,3 +274,121 @@ def test_run_backtest_validates_index_types() -> None:
     
     with pytest.raises(ValueError, match="spread must have DatetimeIndex"):
         run_backtest(signal_valid, spread)
+
+
+def test_backtest_loop_state_machine() -> None:
+    """Test kernel entry, exit, P&L and cost bookkeeping on a tiny input."""
+    signal = np.array([0.0, 2.0, 1.0, 0.1, -2.0, -2.0])
+    spread = np.array([100.0, 100.0, 99.0, 98.0, 98.0, 100.0])
+
+    position, days_held, spread_pnl, cost, n_entries = _backtest_loop(
+        signal, spread, 1.5, 0.5, -1, 10.0, 4750.0, 1.0
+    )
+
+    np.testing.assert_array_equal(position, [0, 1, 1, 0, -1, -1])
+    np.testing.assert_array_equal(days_held, [0, 0, 1, 0, 0, 1])
+    np.testing.assert_allclose(cost, [0.0, 1000.0, 0.0, 1000.0, 1000.0, 0.0])
+    assert n_entries == 2
+    # Long from 100: +1bp tightening, then 2bp more on exit day; short from 98 gains on widening
+    np.testing.assert_allclose(
+        spread_pnl, [0.0, 0.0, 47500.0, 95000.0, 0.0, 95000.0]
+    )
+
+
+def test_backtest_vectorized_matches_loop() -> None:
+    """Test the vectorized no-holding-limit path against the kernel."""
+    rng = np.random.default_rng(7)
+    for _ in range(25):
+        n = int(rng.integers(1, 300))
+        # Rounded signals hit the thresholds exactly on some dates
+        signal = np.round(rng.normal(0, 1.5, n), 1)
+        spread = 100 + np.cumsum(rng.normal(0, 1, n))
+        entry, exit_ = float(rng.choice([0.5, 1.0, 1.5])), float(rng.choice([0.0, 0.3, 0.5]))
+
+        expected = _backtest_loop(signal, spread, entry, exit_, -1, 10.0, 4750.0, 1.0)
+        result = _backtest_vectorized(signal, spread, entry, exit_, 10.0, 4750.0, 1.0)
+
+        for actual, target in zip(result, expected):
+            np.testing.assert_array_equal(actual, target)
+
+
+def test_position_change_mask() -> None:
+    """Test that position changes are flagged against a flat start."""
+    dates = pd.date_range("2024-01-01", periods=6, freq="D")
+    positions = pd.DataFrame({"position": [1, 1, 0, 0, -1, 1]}, index=dates)
+
+    mask = position_change_mask(positions)
+
+    np.testing.assert_array_equal(mask, [True, False, True, False, True, True])
+    assert len(position_change_mask(positions.iloc[:0])) == 0
+
+
+def test_run_backtest_accepts_integer_spread(
+    sample_signal_and_spread: tuple[pd.Series, pd.Series],
+) -> None:
+    """Test that non-float inputs are converted before the kernel runs."""
+    signal, spread = sample_signal_and_spread
+    int_spread = spread.round().astype(np.int64)
+
+    result = run_backtest(signal, int_spread)
+    expected = run_backtest(signal, int_spread.astype(np.float64))
+
+    pd.testing.assert_frame_equal(result.pnl, expected.pnl)
+
+
+@pytest.mark.parametrize("max_holding_days", [None, 10])
+def test_run_backtest_narrow_position_dtypes(
+    sample_signal_and_spread: tuple[pd.Series, pd.Series],
+    max_holding_days: int | None,
+) -> None:
+    """Test that position and days_held use narrow integer dtypes."""
+    signal, spread = sample_signal_and_spread
+    config = BacktestConfig(max_holding_days=max_holding_days)
+
+    result = run_backtest(signal, spread, config)
+
+    assert result.positions["position"].dtype == np.int8
+    assert result.positions["days_held"].dtype == np.int32
+    assert result.positions["position"].abs().sum() > 0
+
+
+def test_run_backtest_aligns_on_common_valid_dates(
+    sample_signal_and_spread: tuple[pd.Series, pd.Series],
+) -> None:
+    """Test that only dates present and non-NaN in both inputs are used."""
+    signal, spread = sample_signal_and_spread
+    signal = signal.copy()
+    signal.iloc[30] = np.nan
+    spread = spread.iloc[10:]
+
+    result = run_backtest(signal, spread)
+
+    expected_dates = spread.index.drop(signal.index[30])
+    pd.testing.assert_index_equal(result.positions.index, expected_dates.rename("date"))
+    assert result.metadata["summary"]["total_days"] == 89
+    np.testing.assert_array_equal(
+        result.positions["spread"].to_numpy(), spread.loc[expected_dates].to_numpy()
+    )
+
+
+def test_compute_performance_metrics_trade_pnls() -> None:
+    """Test per-trade P&L grouping, including a direct long-to-short flip."""
+    dates = pd.date_range("2024-01-01", periods=8, freq="D")
+    positions_df = pd.DataFrame(
+        {
+            "position": [0, 1, 1, -1, -1, 0, 1, 0],
+            "days_held": [0, 1, 2, 1, 2, 0, 1, 0],
+        },
+        index=dates,
+    )
+    net_pnl = pd.Series([0.0, 10.0, 5.0, -4.0, -2.0, 0.0, -3.0, 0.0], index=dates)
+    pnl_df = pd.DataFrame({"net_pnl": net_pnl, "cumulative_pnl": net_pnl.cumsum()})
+
+    metrics = compute_performance_metrics(pnl_df, positions_df)
+
+    # Trades: long +15, short -6, long -3 (the flip is not a new entry)
+    assert metrics.n_trades == 2
+    assert metrics.hit_rate == pytest.approx(1 / 3)
+    assert metrics.avg_win == pytest.approx(15.0)
+    assert metrics.avg_loss == pytest.approx(-4.5)
+    assert metrics.avg_holding_days == pytest.approx(7 / 5)
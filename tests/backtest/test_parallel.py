@@ -0,0 +1,87 @@
+"""
+Unit tests for parallel backtest execution.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aponyx.backtest import (
+    BacktestConfig,
+    run_backtest,
+    run_backtest_grid,
+    run_backtests_parallel,
+)
+
+
+@pytest.fixture
+def signals_and_spread() -> tuple[list[pd.Series], pd.Series]:
+    """Generate two synthetic signals sharing one spread series."""
+    dates = pd.date_range("2024-01-01", periods=120, freq="D")
+    rng = np.random.default_rng(7)
+    spread = pd.Series(100 + np.cumsum(rng.normal(0, 0.5, 120)), index=dates)
+    signals = [
+        pd.Series(rng.normal(0, 1.5, 120), index=dates),
+        pd.Series(rng.normal(0, 1.5, 120), index=dates),
+    ]
+    return signals, spread
+
+
+def test_run_backtests_parallel_matches_serial(
+    signals_and_spread: tuple[list[pd.Series], pd.Series],
+) -> None:
+    """Test that parallel results match individual runs in input order."""
+    signals, spread = signals_and_spread
+    config = BacktestConfig(entry_threshold=1.5, exit_threshold=0.5)
+
+    results = run_backtests_parallel(signals, spread, config, max_workers=2)
+
+    assert len(results) == len(signals)
+    for signal, result in zip(signals, results):
+        expected = run_backtest(signal, spread, config)
+        pd.testing.assert_frame_equal(result.positions, expected.positions)
+        pd.testing.assert_frame_equal(result.pnl, expected.pnl)
+
+
+def test_run_backtests_parallel_single_worker_runs_serially(
+    signals_and_spread: tuple[list[pd.Series], pd.Series],
+) -> None:
+    """Test serial fallback returns one result per signal."""
+    signals, spread = signals_and_spread
+
+    results = run_backtests_parallel(signals, spread, max_workers=1)
+
+    assert [r.metadata["summary"]["total_days"] for r in results] == [120, 120]
+
+
+def test_run_backtest_grid_matches_serial(
+    signals_and_spread: tuple[list[pd.Series], pd.Series],
+) -> None:
+    """Test that grid results match individual runs in config order."""
+    signals, spread = signals_and_spread
+    signal = signals[0].copy()
+    signal.iloc[5] = np.nan
+    configs = [
+        BacktestConfig(entry_threshold=1.0, exit_threshold=0.5),
+        BacktestConfig(entry_threshold=2.0, exit_threshold=0.5, max_holding_days=5),
+    ]
+
+    results = run_backtest_grid(signal, spread.iloc[3:], configs, max_workers=2)
+
+    assert len(results) == len(configs)
+    for config, result in zip(configs, results):
+        expected = run_backtest(signal, spread.iloc[3:], config)
+        pd.testing.assert_frame_equal(result.positions, expected.positions)
+        pd.testing.assert_frame_equal(result.pnl, expected.pnl)
+        assert result.metadata["summary"] == expected.metadata["summary"]
+
+
+def test_run_backtest_grid_validates_index_types(
+    signals_and_spread: tuple[list[pd.Series], pd.Series],
+) -> None:
+    """Test that non-datetime inputs are rejected before sharing."""
+    signals, spread = signals_and_spread
+    configs = [BacktestConfig(), BacktestConfig(entry_threshold=2.0)]
+
+    with pytest.raises(ValueError, match="composite_signal must have DatetimeIndex"):
+        run_backtest_grid(signals[0].reset_index(drop=True), spread, configs, max_workers=2)
@@ -0,0 +1,61 @@
+"""Tests for fetch caching layer."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from aponyx.data.cache import _generate_cache_key, get_cached_data, save_to_cache
+from aponyx.data.sources import APISource, FileSource
+
+
+def test_cache_key_distinguishes_file_sources() -> None:
+    """Test that different source files produce different cache keys."""
+    key_a = _generate_cache_key(FileSource("a.parquet"), "cdx", None, None, tenor="5Y")
+    key_b = _generate_cache_key(FileSource("b.parquet"), "cdx", None, None, tenor="5Y")
+
+    assert key_a != key_b
+    assert key_a == _generate_cache_key(FileSource("a.parquet"), "cdx", None, None, tenor="5Y")
+
+
+def test_cache_key_normalizes_file_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that relative and absolute paths to one file share a cache key."""
+    monkeypatch.chdir(tmp_path)
+    relative = FileSource(Path("data") / "cdx.parquet")
+    absolute = FileSource(tmp_path / "data" / "cdx.parquet")
+
+    assert _generate_cache_key(relative, "cdx", None, None) == _generate_cache_key(
+        absolute, "cdx", None, None
+    )
+    assert _generate_cache_key(
+        APISource("https://example.com/cdx", {"b": 2, "a": 1}), "cdx", None, None
+    ) == _generate_cache_key(
+        APISource("https://example.com/cdx", {"a": 1, "b": 2}), "cdx", None, None
+    )
+
+
+def test_get_cached_data_returns_independent_copies(tmp_path: Path) -> None:
+    """Test that in-memory cache hits cannot be mutated by callers."""
+    source = FileSource(tmp_path / "cdx.parquet")
+    df = pd.DataFrame(
+        {"spread": [100.0, 101.0, 102.0]},
+        index=pd.date_range("2024-01-01", periods=3, name="date"),
+    )
+    save_to_cache(df, source, "cdx", tmp_path)
+
+    first = get_cached_data(source, "cdx", tmp_path)
+    assert first is not None
+    first.loc[first.index[0], "spread"] = -1.0
+
+    second = get_cached_data(source, "cdx", tmp_path)
+    pd.testing.assert_frame_equal(second, df, check_freq=False)
+
+
+def test_cache_miss_does_not_create_directories(tmp_path: Path) -> None:
+    """Test that cache lookups leave the filesystem untouched."""
+    cache_dir = tmp_path / "cache"
+
+    assert get_cached_data(FileSource(tmp_path / "cdx.parquet"), "cdx", cache_dir) is None
+    assert not cache_dir.exists()
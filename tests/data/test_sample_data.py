@@ -0,0 +1,106 @@
+"""Tests for synthetic sample data generation."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from aponyx.data.sample_data import (
+    _mean_reverting_path,
+    generate_full_sample_dataset,
+    generate_vix_sample,
+)
+
+
+def test_generate_full_sample_dataset_reuses_existing_files(tmp_path: Path) -> None:
+    """Test that repeat calls with identical arguments skip regeneration."""
+    first = generate_full_sample_dataset(str(tmp_path), periods=30, seed=1)
+    mtimes = {key: Path(path).stat().st_mtime_ns for key, path in first.items()}
+
+    second = generate_full_sample_dataset(str(tmp_path), periods=30, seed=1)
+
+    assert second == first
+    assert {key: Path(path).stat().st_mtime_ns for key, path in second.items()} == mtimes
+
+
+def test_generate_full_sample_dataset_regenerates_missing_files(tmp_path: Path) -> None:
+    """Test that a stale manifest does not hide deleted outputs."""
+    paths = generate_full_sample_dataset(str(tmp_path), periods=30, seed=1)
+    Path(paths["vix"]).unlink()
+
+    regenerated = generate_full_sample_dataset(str(tmp_path), periods=30, seed=1)
+
+    assert Path(regenerated["vix"]).exists()
+
+
+def test_generate_full_sample_dataset_regenerates_after_other_arguments(
+    tmp_path: Path,
+) -> None:
+    """Test that outputs overwritten by other arguments are not reused."""
+    first = generate_full_sample_dataset(str(tmp_path), periods=30, seed=42)
+    expected = pd.read_parquet(first["vix"])
+    generate_full_sample_dataset(str(tmp_path), periods=30, seed=43)
+
+    again = generate_full_sample_dataset(str(tmp_path), periods=30, seed=42)
+
+    pd.testing.assert_frame_equal(pd.read_parquet(again["vix"]), expected)
+
+
+def test_generate_full_sample_dataset_regenerates_modified_files(tmp_path: Path) -> None:
+    """Test that files changed after generation are not reused."""
+    paths = generate_full_sample_dataset(str(tmp_path), periods=30, seed=1)
+    expected = pd.read_parquet(paths["vix"])
+    expected.iloc[:5].to_parquet(paths["vix"])
+
+    regenerated = generate_full_sample_dataset(str(tmp_path), periods=30, seed=1)
+
+    pd.testing.assert_frame_equal(pd.read_parquet(regenerated["vix"]), expected)
+
+
+def test_mean_reverting_path_reverts_and_floors() -> None:
+    """Test AR(1) stepping, mean reversion and the lower bound."""
+    path = _mean_reverting_path(10.0, 20.0, 0.5, np.array([0.0, 0.0, -100.0]), 1.0)
+
+    np.testing.assert_allclose(path, [10.0, 15.0, 17.5, 1.0])
+
+
+def test_generate_vix_sample_respects_floor() -> None:
+    """Test VIX generation length, floor and determinism."""
+    vix = generate_vix_sample(periods=500, base_vix=9.0, volatility=4.0, seed=5)
+
+    assert len(vix) == 500
+    assert vix["close"].iloc[0] == 9.0
+    assert (vix["close"] >= 8.0).all()
+    pd.testing.assert_frame_equal(
+        vix, generate_vix_sample(periods=500, base_vix=9.0, volatility=4.0, seed=5)
+    )
+
+
+def test_generate_full_sample_dataset_parallel_matches_serial(tmp_path: Path) -> None:
+    """Test that process-parallel generation reproduces serial output."""
+    serial = generate_full_sample_dataset(str(tmp_path / "serial"), periods=40, seed=2)
+
+    parallel = generate_full_sample_dataset(
+        str(tmp_path / "parallel"), periods=40, seed=2, max_workers=2
+    )
+
+    for key in serial:
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(parallel[key]), pd.read_parquet(serial[key])
+        )
+
+
+def test_generate_full_sample_dataset_writes_row_group_per_series(tmp_path: Path) -> None:
+    """Test that combined files hold one row group per series, in order."""
+    file_paths = generate_full_sample_dataset(str(tmp_path), periods=30, seed=5)
+
+    cdx = pd.read_parquet(file_paths["cdx"])
+    assert pq.ParquetFile(file_paths["cdx"]).num_row_groups == 2
+    assert list(cdx["index"].unique()) == ["CDX_IG_5Y", "CDX_HY_5Y"]
+    assert isinstance(cdx.index, pd.RangeIndex)
+    assert len(cdx) == 60
+
+    etf = pd.read_parquet(file_paths["etf"])
+    assert pq.ParquetFile(file_paths["etf"]).num_row_groups == 2
+    assert list(etf["ticker"].unique()) == ["HYG", "LQD"]
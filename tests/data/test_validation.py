@@ -159,3 +159,55 @@ def test_validate_cdx_schema_already_indexed() -> None:
 
     assert isinstance(validated.index, pd.DatetimeIndex)
     assert len(validated) == 3
+
+
+def test_validate_cdx_schema_string_dates_leave_input_unchanged() -> None:
+    """Test that string date columns are parsed without mutating the input."""
+    df = pd.DataFrame(
+        {
+            "date": ["2024-01-03", "2024-01-01", "2024-01-02"],
+            "spread": [102.0, 100.0, 101.0],
+            "index": ["CDX_IG_5Y"] * 3,
+        }
+    )
+
+    validated = validate_cdx_schema(df)
+
+    assert isinstance(validated.index, pd.DatetimeIndex)
+    assert validated.index.is_monotonic_increasing
+    assert list(validated["spread"]) == [100.0, 101.0, 102.0]
+    assert df["date"].dtype == object
+    assert list(df.columns) == ["date", "spread", "index"]
+
+
+def test_validate_etf_schema_duplicate_dates_per_ticker(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that ETF duplicates are counted per ticker, not across tickers."""
+    dates = pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-02"])
+    df = pd.DataFrame(
+        {
+            "date": dates.append(dates),
+            "close": [75.0, 75.5, 75.6, 110.0, 110.2, 110.1],
+            "ticker": ["HYG"] * 3 + ["LQD"] * 2 + ["HYG"],
+        }
+    )
+
+    validated = validate_etf_schema(df)
+
+    assert "Found 2 duplicate dates for ticker HYG" in caplog.text
+    assert "ticker LQD" not in caplog.text
+    assert len(validated) == 6
+
+
+@pytest.mark.parametrize("dtype", ["Float64", "Int64", "object"])
+def test_validate_vix_schema_nullable_dtypes(dtype: str) -> None:
+    """Test bounds checks on nullable and object columns, with and without NA."""
+    dates = pd.date_range("2024-01-01", periods=3)
+    valid = pd.DataFrame({"date": dates, "close": pd.array([15, 20, 25], dtype=dtype)})
+
+    assert len(validate_vix_schema(valid)) == 3
+
+    missing = pd.DataFrame({"date": dates, "close": pd.array([15, None, 25], dtype=dtype)})
+    with pytest.raises(ValueError, match="VIX values outside valid range"):
+        validate_vix_schema(missing)
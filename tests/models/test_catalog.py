@@ -9,6 +9,7 @@ import pytest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+from aponyx.models import catalog
 from aponyx.models.catalog import compute_registered_signals, _validate_data_requirements
 from aponyx.models.config import SignalConfig
 from aponyx.models.registry import SignalRegistry, SignalMetadata
@@ -62,6 +63,62 @@ def test_compute_registered_signals_all_enabled(
         assert len(signal) == 50
 
 
+def test_compute_registered_signals_threaded_matches_serial(
+    test_catalog_path: Path,
+    mock_market_data: dict[str, pd.DataFrame],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test thread-pool computation matches serial results and order."""
+    registry = SignalRegistry(test_catalog_path)
+    config = SignalConfig(lookback=10, min_periods=5)
+
+    pools = []
+
+    class RecordingExecutor(catalog.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(catalog, "ThreadPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(catalog.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(catalog, "_PARALLEL_MIN_ROWS", 0)
+    threaded = compute_registered_signals(registry, mock_market_data, config)
+    assert len(pools) == 1
+
+    monkeypatch.setattr(catalog, "_PARALLEL_MIN_SIGNALS", 100)
+    serial = compute_registered_signals(registry, mock_market_data, config)
+    assert len(pools) == 1
+
+    assert list(threaded) == list(registry.get_enabled())
+    assert list(threaded) == list(serial)
+    for name in serial:
+        pd.testing.assert_series_equal(threaded[name], serial[name])
+
+
+@pytest.mark.parametrize(("cpu_count", "min_rows"), [(1, 0), (4, 51)])
+def test_compute_registered_signals_serial_for_small_workloads(
+    test_catalog_path: Path,
+    mock_market_data: dict[str, pd.DataFrame],
+    monkeypatch: pytest.MonkeyPatch,
+    cpu_count: int,
+    min_rows: int,
+) -> None:
+    """Test that one CPU or short inputs skip the thread pool."""
+    registry = SignalRegistry(test_catalog_path)
+    config = SignalConfig(lookback=10, min_periods=5)
+
+    def fail_executor(*args, **kwargs):
+        raise AssertionError("thread pool should not be started")
+
+    monkeypatch.setattr(catalog, "ThreadPoolExecutor", fail_executor)
+    monkeypatch.setattr(catalog.os, "cpu_count", lambda: cpu_count)
+    monkeypatch.setattr(catalog, "_PARALLEL_MIN_ROWS", min_rows)
+
+    signals = compute_registered_signals(registry, mock_market_data, config)
+
+    assert list(signals) == list(registry.get_enabled())
+
+
 def test_compute_registered_signals_with_disabled(mock_market_data: dict[str, pd.DataFrame]) -> None:
     """Test that disabled signals are not computed."""
     catalog_data = [
@@ -3,11 +3,13 @@ Unit tests for signal registry and metadata.
 """
 
 import json
+import os
 import pytest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Generator
 
+from aponyx.models import signals
 from aponyx.models.registry import SignalRegistry, SignalMetadata
 
 
@@ -142,6 +144,41 @@ def test_signal_registry_get_metadata_not_found(temp_catalog_file: Path) -> None
         registry.get_metadata("nonexistent")
 
 
+def test_signal_registry_get_compute_fn(tmp_path: Path) -> None:
+    """Test compute function resolution is lazy and cached per registry."""
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(
+        json.dumps(
+            [
+                {
+                    "name": "momentum",
+                    "description": "Spread momentum",
+                    "compute_function_name": "compute_spread_momentum",
+                    "data_requirements": {"cdx": "spread"},
+                    "arg_mapping": ["cdx"],
+                },
+                {
+                    "name": "broken",
+                    "description": "Unknown function",
+                    "compute_function_name": "nonexistent_function",
+                    "data_requirements": {"cdx": "spread"},
+                    "arg_mapping": ["cdx"],
+                },
+            ]
+        )
+    )
+    registry = SignalRegistry(catalog_path)
+
+    compute_fn = registry.get_compute_fn("momentum")
+    assert compute_fn is signals.compute_spread_momentum
+    assert registry.get_compute_fn("momentum") is compute_fn
+
+    with pytest.raises(AttributeError):
+        registry.get_compute_fn("broken")
+    with pytest.raises(KeyError, match="Signal 'missing' not found"):
+        registry.get_compute_fn("missing")
+
+
 def test_signal_registry_get_enabled(temp_catalog_file: Path) -> None:
     """Test retrieving enabled signals."""
     registry = SignalRegistry(temp_catalog_file)
@@ -263,3 +300,63 @@ def test_signal_registry_invalid_metadata_entry() -> None:
         
         with pytest.raises(ValueError, match="Invalid signal metadata"):
             SignalRegistry(catalog_path)
+
+
+def test_signal_registry_reloads_modified_catalog(
+    temp_catalog_file: Path, sample_catalog_data: list[dict]
+) -> None:
+    """Test that cached catalog parse is invalidated when the file changes."""
+    assert len(SignalRegistry(temp_catalog_file).list_all()) == 2
+
+    with open(temp_catalog_file, "w") as f:
+        json.dump(sample_catalog_data[:1], f)
+    stat = temp_catalog_file.stat()
+    os.utime(temp_catalog_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    signals = SignalRegistry(temp_catalog_file).list_all()
+    assert list(signals) == ["test_signal_a"]
+
+
+def test_signal_registry_reloads_catalog_rewritten_with_same_mtime(
+    temp_catalog_file: Path, sample_catalog_data: list[dict]
+) -> None:
+    """Test that a size change invalidates the cache even if mtime is unchanged."""
+    stat = temp_catalog_file.stat()
+    assert len(SignalRegistry(temp_catalog_file).list_all()) == 2
+
+    with open(temp_catalog_file, "w") as f:
+        json.dump(sample_catalog_data[:1], f)
+    os.utime(temp_catalog_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    signals = SignalRegistry(temp_catalog_file).list_all()
+    assert list(signals) == ["test_signal_a"]
+
+
+def test_signal_registry_get_enabled_returns_independent_copies(
+    temp_catalog_file: Path,
+) -> None:
+    """Test that mutating a get_enabled result does not affect the registry."""
+    registry = SignalRegistry(temp_catalog_file)
+
+    enabled = registry.get_enabled()
+    enabled.pop("test_signal_a")
+
+    assert set(registry.get_enabled()) == {"test_signal_a", "test_signal_b"}
+
+
+def test_signal_registry_instances_do_not_share_mutable_metadata(
+    temp_catalog_file: Path,
+) -> None:
+    """Test that registries loading the same catalog own separate metadata."""
+    first = SignalRegistry(temp_catalog_file)
+    second = SignalRegistry(temp_catalog_file)
+
+    first.get_metadata("test_signal_a").data_requirements["extra"] = "close"
+    first.get_metadata("test_signal_a").arg_mapping.append("extra")
+
+    metadata = second.get_metadata("test_signal_a")
+    assert "extra" not in metadata.data_requirements
+    assert "extra" not in metadata.arg_mapping
+    assert "extra" not in SignalRegistry(temp_catalog_file).get_metadata(
+        "test_signal_a"
+    ).data_requirements
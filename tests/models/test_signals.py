@@ -10,6 +10,7 @@ from aponyx.models.signals import (
     compute_cdx_etf_basis,
     compute_cdx_vix_gap,
     compute_spread_momentum,
+    _rolling_mean_std,
 )
 from aponyx.models.config import SignalConfig
 
@@ -151,3 +152,46 @@ def test_signals_deterministic(
     pd.testing.assert_series_equal(basis1, basis2)
     pd.testing.assert_series_equal(gap1, gap2)
     pd.testing.assert_series_equal(momentum1, momentum2)
+
+
+def test_signals_are_float64_for_float32_inputs(
+    sample_cdx_data: pd.DataFrame,
+    sample_vix_data: pd.DataFrame,
+    sample_etf_data: pd.DataFrame,
+) -> None:
+    """Test that signals are float64 regardless of input precision."""
+    cdx_df = sample_cdx_data.astype(np.float32)
+    config = SignalConfig(lookback=15, min_periods=8)
+
+    basis = compute_cdx_etf_basis(cdx_df, sample_etf_data.astype(np.float32), config)
+    gap = compute_cdx_vix_gap(cdx_df, sample_vix_data.astype(np.float32), config)
+    momentum = compute_spread_momentum(cdx_df, config)
+
+    assert basis.dtype == np.float64
+    assert gap.dtype == np.float64
+    assert momentum.dtype == np.float64
+
+
+def test_rolling_mean_std_matches_pandas() -> None:
+    """Test windowed statistics against pandas rolling, including NaN gaps."""
+    rng = np.random.default_rng(0)
+    values = 100 + np.cumsum(rng.normal(0, 2, 60))
+    values[[3, 17, 18, 40]] = np.nan
+
+    mean, std = _rolling_mean_std(values, lookback=10, min_periods=4)
+
+    rolling = pd.Series(values).rolling(window=10, min_periods=4)
+    np.testing.assert_allclose(mean, rolling.mean().to_numpy(), rtol=1e-10)
+    np.testing.assert_allclose(std, rolling.std().to_numpy(), rtol=1e-8)
+
+
+def test_rolling_mean_std_constant_window_is_exact() -> None:
+    """Test that constant windows give exactly zero std, as pandas does."""
+    values = np.array([[0.1, 1.0], [0.1, 2.0], [0.1, 3.0], [0.1, 3.0], [0.1, 3.0]])
+
+    mean, std = _rolling_mean_std(values, lookback=3, min_periods=2)
+
+    np.testing.assert_array_equal(std[1:, 0], 0.0)
+    np.testing.assert_array_equal(mean[1:, 0], 0.1)
+    assert std[-1, 1] == 0.0
+    assert np.isnan(std[0]).all()
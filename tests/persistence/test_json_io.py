@@ -6,6 +6,7 @@ from pathlib import Path
 from datetime import datetime
 import numpy as np
 
+from aponyx.persistence import json_io
 from aponyx.persistence.json_io import (
     save_json,
     load_json,
@@ -28,6 +29,16 @@ def sample_metadata():
     }
 
 
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test once with orjson (if installed) and once without."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_io, "orjson", None)
+    return request.param
+
+
 @pytest.fixture
 def temp_data_dir(tmp_path):
     """Create temporary directory for test data."""
@@ -164,3 +175,57 @@ class TestLoadJSON:
         loaded = load_json(file_path)
 
         assert loaded == data
+
+
+class TestBackendConsistency:
+    """Test that orjson and the standard library fallback agree."""
+
+    def test_roundtrip_special_types(self, json_backend, temp_data_dir):
+        """Test NaN, Inf, numpy, datetime and Path values round-trip the same."""
+        data = {
+            "nan": float("nan"),
+            "inf": float("inf"),
+            "np_nan": np.float64("nan"),
+            "np_float32": np.float32(0.5),
+            "np_int": np.int64(7),
+            "array": np.array([1.0, np.nan, -np.inf]),
+            "nested": {"values": [float("nan"), 1.5], "pair": (2, float("-inf"))},
+            "timestamp": datetime(2024, 10, 25, 14, 30, 0, 123456),
+            "path": Path("/data/cdx_ig_5y.parquet"),
+        }
+        file_path = temp_data_dir / f"{json_backend}.json"
+
+        save_json(data, file_path)
+        loaded = load_json(file_path)
+
+        assert loaded == {
+            "nan": None,
+            "inf": None,
+            "np_nan": None,
+            "np_float32": 0.5,
+            "np_int": 7,
+            "array": [1.0, None, None],
+            "nested": {"values": [None, 1.5], "pair": [2, None]},
+            "timestamp": "2024-10-25T14:30:00.123456",
+            "path": str(Path("/data/cdx_ig_5y.parquet")),
+        }
+        # Strict JSON: readable by any standard parser
+        json.loads(file_path.read_text(), parse_constant=pytest.fail)
+
+    def test_save_does_not_mutate_input(self, json_backend, temp_data_dir):
+        """Test that replacing non-finite values works on a copy."""
+        data = {"values": [float("nan")]}
+
+        save_json(data, temp_data_dir / "data.json")
+
+        assert np.isnan(data["values"][0])
+
+    def test_load_legacy_nan_tokens(self, json_backend, temp_data_dir):
+        """Test that files with non-standard NaN tokens still load."""
+        file_path = temp_data_dir / "legacy.json"
+        file_path.write_text('{"a": NaN, "b": 1.0}')
+
+        loaded = load_json(file_path)
+
+        assert np.isnan(loaded["a"])
+        assert loaded["b"] == 1.0
@@ -3,13 +3,17 @@
 import pytest
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime, timedelta
 
+from aponyx.persistence import parquet_io
 from aponyx.persistence.parquet_io import (
     save_parquet,
+    save_parquet_row_groups,
     load_parquet,
     list_parquet_files,
+    clear_parquet_cache,
 )
 
 
@@ -54,7 +58,7 @@ class TestSaveParquet:
 
     def test_save_with_compression(self, sample_timeseries, temp_data_dir):
         """Test different compression algorithms."""
-        for compression in ["snappy", "gzip", "zstd"]:
+        for compression in ["lz4", "snappy", "gzip", "zstd"]:
             file_path = temp_data_dir / f"test_{compression}.parquet"
             result = save_parquet(sample_timeseries, file_path, compression=compression)
             assert result.exists()
@@ -67,6 +71,30 @@ class TestSaveParquet:
         df = pd.read_parquet(file_path)
         assert isinstance(df.index, pd.RangeIndex)
 
+    def test_save_encodings_and_row_groups(self, temp_data_dir):
+        """Test column encodings and row-group splitting for long series."""
+        n = 40_000
+        df = pd.DataFrame(
+            {
+                "spread": np.random.uniform(90, 110, n),
+                "index": ["CDX_IG_5Y"] * n,
+            },
+            index=pd.date_range("1990-01-01", periods=n, freq="D", name="date"),
+        )
+        file_path = temp_data_dir / "long.parquet"
+        save_parquet(df, file_path)
+
+        metadata = pq.ParquetFile(file_path).metadata
+        assert metadata.num_row_groups == 8
+        columns = {
+            metadata.row_group(0).column(i).path_in_schema: metadata.row_group(0).column(i)
+            for i in range(metadata.num_columns)
+        }
+        assert "BYTE_STREAM_SPLIT" in columns["spread"].encodings
+        assert columns["index"].has_dictionary_page
+
+        pd.testing.assert_frame_equal(load_parquet(file_path), df, check_freq=False)
+
     def test_save_empty_dataframe_raises(self, temp_data_dir):
         """Test that saving empty DataFrame raises ValueError."""
         empty_df = pd.DataFrame()
@@ -74,6 +102,31 @@ class TestSaveParquet:
             save_parquet(empty_df, temp_data_dir / "empty.parquet")
 
 
+class TestSaveParquetRowGroups:
+    """Test cases for save_parquet_row_groups function."""
+
+    def test_save_one_row_group_per_frame(self, tmp_path):
+        """Test frames are written in order, one row group each."""
+        frames = [
+            pd.DataFrame({"ticker": [ticker] * 3, "close": np.arange(3.0)})
+            for ticker in ("HYG", "LQD")
+        ]
+        file_path = tmp_path / "nested" / "etf.parquet"
+
+        result = save_parquet_row_groups(frames, file_path)
+
+        assert result == file_path.absolute()
+        assert pq.ParquetFile(file_path).num_row_groups == 2
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(file_path), pd.concat(frames, ignore_index=True)
+        )
+
+    def test_save_no_frames_raises(self, temp_data_dir):
+        """Test that an empty frame list raises ValueError."""
+        with pytest.raises(ValueError, match="empty list"):
+            save_parquet_row_groups([], temp_data_dir / "empty.parquet")
+
+
 class TestLoadParquet:
     """Test cases for load_parquet function."""
 
@@ -107,6 +160,88 @@ class TestLoadParquet:
         assert loaded.index.max() <= end
         assert len(loaded) == 5
 
+    def test_load_date_filter_with_columns(self, sample_timeseries, temp_data_dir):
+        """Test date filtering combined with column selection on a named index."""
+        df = sample_timeseries.assign(volume=1.0)
+        df.index.name = "date"
+        file_path = temp_data_dir / "named.parquet"
+        save_parquet(df, file_path)
+
+        start = pd.Timestamp("2024-01-08")
+        loaded = load_parquet(file_path, columns=["spread"], start_date=start)
+
+        expected = df.loc[df.index >= start, ["spread"]]
+        pd.testing.assert_frame_equal(loaded, expected, check_freq=False)
+
+    def test_load_date_filter_tz_aware_index(self, sample_timeseries, temp_data_dir):
+        """Test that timezone-aware indexes are filtered correctly."""
+        df = sample_timeseries.tz_localize("UTC")
+        file_path = temp_data_dir / "tz.parquet"
+        save_parquet(df, file_path)
+
+        loaded = load_parquet(file_path, end_date=pd.Timestamp("2024-01-02", tz="UTC"))
+        assert len(loaded) == 2
+
+    def test_load_in_memory_date_filter_sorted_and_unsorted(
+        self, sample_timeseries, temp_data_dir
+    ):
+        """Test in-memory filtering for sorted (sliced) and unsorted indexes."""
+        df = sample_timeseries.tz_localize("UTC")
+        start = pd.Timestamp("2024-01-03", tz="UTC")
+        end = pd.Timestamp("2024-01-07", tz="UTC")
+        expected = df[(df.index >= start) & (df.index <= end)]
+
+        for name, frame in [("sorted", df), ("unsorted", df.iloc[::-1])]:
+            file_path = temp_data_dir / f"tz_{name}.parquet"
+            save_parquet(frame, file_path)
+            loaded = load_parquet(file_path, start_date=start, end_date=end)
+            pd.testing.assert_frame_equal(
+                loaded.sort_index(), expected, check_freq=False
+            )
+
+    @pytest.mark.parametrize("cache", [False, True])
+    def test_load_repeated_reads_are_independent_and_fresh(
+        self, sample_timeseries, temp_data_dir, cache
+    ):
+        """Test repeated reads return separate frames and see rewritten files."""
+        file_path = temp_data_dir / "cached.parquet"
+        save_parquet(sample_timeseries, file_path)
+
+        first = load_parquet(file_path, cache=cache)
+        first["spread"] = 0.0
+        pd.testing.assert_frame_equal(
+            load_parquet(file_path, cache=cache), sample_timeseries, check_freq=False
+        )
+
+        save_parquet(sample_timeseries.iloc[:4], file_path)
+        assert len(load_parquet(file_path, cache=cache)) == 4
+
+    def test_load_cache_is_opt_in_bounded_and_clearable(
+        self, sample_timeseries, temp_data_dir, monkeypatch
+    ):
+        """Test the table cache is only used on request and stays within budget."""
+        table_cache = parquet_io._TableCache(max_bytes=0)
+        monkeypatch.setattr(parquet_io, "_table_cache", table_cache)
+        paths = []
+        for name in ("a", "b", "c"):
+            paths.append(temp_data_dir / f"{name}.parquet")
+            save_parquet(sample_timeseries, paths[-1])
+
+        load_parquet(paths[0])
+        assert len(table_cache._tables) == 0
+
+        # Room for two tables: the least recently used one is evicted
+        table_cache.max_bytes = 2 * pq.read_table(paths[0]).nbytes
+        for path in paths:
+            load_parquet(path, cache=True)
+        cached_paths = [key[0] for key in table_cache._tables]
+        assert cached_paths == [str(path.resolve()) for path in paths[1:]]
+        assert table_cache._nbytes <= table_cache.max_bytes
+
+        clear_parquet_cache()
+        assert len(table_cache._tables) == 0
+        assert table_cache._nbytes == 0
+
     def test_load_nonexistent_file_raises(self, temp_data_dir):
         """Test that loading nonexistent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
@@ -122,6 +257,28 @@ class TestLoadParquet:
             load_parquet(file_path, start_date=pd.Timestamp("2024-01-01"))
 
 
+    def test_load_with_downcast_and_categoricals(self, temp_data_dir):
+        """Test optional dtype narrowing on load."""
+        df = pd.DataFrame(
+            {
+                "close": [75.25, 75.5, 110.75],
+                "series": [41, 42, 300],
+                "ticker": ["HYG", "HYG", "LQD"],
+            },
+            index=pd.date_range("2024-01-01", periods=3, freq="D"),
+        )
+        file_path = temp_data_dir / "etf.parquet"
+        save_parquet(df, file_path)
+
+        loaded = load_parquet(file_path, downcast=True, categoricals=["ticker"])
+
+        assert loaded["close"].dtype == np.float32
+        assert loaded["series"].dtype == np.int16
+        assert isinstance(loaded["ticker"].dtype, pd.CategoricalDtype)
+        np.testing.assert_array_equal(loaded["close"].to_numpy(), df["close"].to_numpy())
+        assert load_parquet(file_path)["close"].dtype == np.float64
+
+
 class TestListParquetFiles:
     """Test cases for list_parquet_files function."""
 
@@ -162,3 +319,18 @@ class TestListParquetFiles:
         files = list_parquet_files(temp_data_dir)
         names = [f.name for f in files]
         assert names == sorted(names)
+
+    def test_list_matches_glob_semantics(self, sample_timeseries, temp_data_dir):
+        """Test single-level and nested patterns agree with Path.glob."""
+        for name in ["cdx_ig.parquet", "vix.parquet", "notes.csv", "sub/cdx_hy.parquet"]:
+            path = temp_data_dir / name
+            path.parent.mkdir(exist_ok=True)
+            if path.suffix == ".parquet":
+                save_parquet(sample_timeseries, path)
+            else:
+                path.touch()
+
+        for pattern in ["*.parquet", "*", "cdx_??.parquet", "sub/*.parquet", "**/cdx_*.parquet"]:
+            assert list_parquet_files(temp_data_dir, pattern) == sorted(
+                temp_data_dir.glob(pattern)
+            )
@@ -243,6 +243,26 @@ class TestListDatasets:
         assert len(datasets_5y) == 2
         assert "cdx_ig_10y" not in datasets_5y
 
+    def test_list_filtered_by_instrument_prefix(self, registry, temp_data_dir):
+        """Test filtering datasets by instrument prefix."""
+        registry.register_dataset(
+            name="cdx_ig_5y",
+            file_path=temp_data_dir / "cdx_ig_5y.parquet",
+            instrument="CDX.NA.IG",
+        )
+        registry.register_dataset(
+            name="cdx_hy_5y",
+            file_path=temp_data_dir / "cdx_hy_5y.parquet",
+            instrument="CDX.NA.HY",
+        )
+        registry.register_dataset(
+            name="vix",
+            file_path=temp_data_dir / "vix.parquet",
+            instrument="VIX",
+        )
+
+        assert registry.list_datasets(instrument_prefix="CDX") == ["cdx_hy_5y", "cdx_ig_5y"]
+
     def test_list_empty_registry(self, registry):
         """Test listing datasets from empty registry."""
         datasets = registry.list_datasets()
@@ -311,6 +331,39 @@ class TestRemoveDataset:
             registry.remove_dataset("nonexistent")
 
 
+class TestBatch:
+    """Test cases for deferred registry writes."""
+
+    def test_batch_writes_once_on_exit(self, registry, temp_data_dir):
+        """Test that registry file is only rewritten when the batch exits."""
+        registry_path = temp_data_dir / "registry.json"
+
+        with registry.batch():
+            registry.register_dataset(
+                name="a", file_path=temp_data_dir / "a.parquet", instrument="A"
+            )
+            registry.register_dataset(
+                name="b", file_path=temp_data_dir / "b.parquet", instrument="B"
+            )
+            assert DataRegistry(registry_path, temp_data_dir).list_datasets() == []
+
+        reloaded = DataRegistry(registry_path, temp_data_dir)
+        assert reloaded.list_datasets() == ["a", "b"]
+        assert not (temp_data_dir / "registry.json.tmp").exists()
+
+    def test_batch_saves_on_error(self, registry, temp_data_dir):
+        """Test that changes made before an error are still persisted."""
+        with pytest.raises(RuntimeError):
+            with registry.batch():
+                registry.register_dataset(
+                    name="a", file_path=temp_data_dir / "a.parquet", instrument="A"
+                )
+                raise RuntimeError("boom")
+
+        reloaded = DataRegistry(temp_data_dir / "registry.json", temp_data_dir)
+        assert reloaded.list_datasets() == ["a"]
+
+
 class TestRegistryRepr:
     """Test cases for DataRegistry string representation."""
 
@@ -511,3 +564,19 @@ class TestGetDatasetEntry:
         # Convert entry to dict and compare
         assert entry.to_dict() == info
 
+    def test_get_many_preserves_order(self, registry, sample_timeseries, temp_data_dir):
+        """Test bulk retrieval returns entries in request order."""
+        file_path = temp_data_dir / "test.parquet"
+        save_parquet(sample_timeseries, file_path)
+        registry.register_dataset(name="a", file_path=file_path, instrument="A")
+        registry.register_dataset(name="b", file_path=file_path, instrument="B")
+
+        entries = registry.get_many(["b", "a"])
+
+        assert [e.instrument for e in entries] == ["B", "A"]
+        assert entries[0] == registry.get_dataset_entry("b")
+
+    def test_get_many_missing_raises(self, registry):
+        """Test that bulk retrieval reports missing datasets."""
+        with pytest.raises(KeyError, match="nonexistent"):
+            registry.get_many(["nonexistent"])